@@ -5,57 +5,76 @@ Processes map tiles with CNN and combines with vector features
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
+from torch.nn.utils.fusion import fuse_conv_bn_eval
 from gymnasium import spaces
 from stable_baselines3.common.torch_layers import BaseFeaturesExtractor
 from stable_baselines3.common.policies import ActorCriticPolicy
-from typing import Dict
-
+from typing import Dict, Optional
 
 class PokemonCNNExtractor(BaseFeaturesExtractor):
     """
     Custom feature extractor for Pokemon game state.
     
     Processes:
-    - Map tiles (7x7x3) with CNN
+    - Map tiles (3x7x7, channels-first) with CNN
     - Vector features (18) with linear layers
     - Combines both with fusion layer
     """
     
-    def __init__(self, observation_space: spaces.Dict, features_dim: int = 256):
+    def __init__(
+        self,
+        observation_space: spaces.Dict,
+        features_dim: int = 256,
+        rollout_dtype: Optional[torch.dtype] = None,
+    ):
         """
         Initialize the feature extractor.
         
         Args:
             observation_space: Dictionary space with 'map' and 'vector' keys
             features_dim: Output dimension of the combined features
+            rollout_dtype: Optional reduced precision (e.g. torch.bfloat16) for
+                          the inference-only CNN/fusion copies. Training and
+                          the saved weights stay float32.
         """
         super().__init__(observation_space, features_dim)
+        self.rollout_dtype = rollout_dtype
         
         # Extract dimensions
-        map_shape = observation_space['map'].shape  # (7, 7, 3)
+        map_shape = observation_space['map'].shape  # (3, 7, 7)
         vector_dim = observation_space['vector'].shape[0]  # 18
         
         # === CNN for map processing ===
-        # Input: (batch, 3, 7, 7) - channels first for PyTorch
+        # Input: (batch, 3, 7, 7) - the env already emits channels-first
+        # Conv -> BN -> ReLU so each BN can be folded into its conv at inference
         self.map_cnn = nn.Sequential(
             # Conv layer 1: 3 -> 32 channels
-            nn.Conv2d(in_channels=3, out_channels=32, kernel_size=3, stride=1, padding=1),
-            nn.ReLU(),
+            nn.Conv2d(in_channels=map_shape[0], out_channels=32, kernel_size=3, stride=1, padding=1),
             nn.BatchNorm2d(32),
+            nn.ReLU(),
             
             # Conv layer 2: 32 -> 64 channels
             nn.Conv2d(in_channels=32, out_channels=64, kernel_size=3, stride=1, padding=1),
-            nn.ReLU(),
             nn.BatchNorm2d(64),
+            nn.ReLU(),
             
             # Flatten: 64 * 7 * 7 = 3136 features
             nn.Flatten()
         )
         
+        # Inference-only copy of map_cnn with BN folded into the convs.
+        # Stored outside the module registry so it never shows up in
+        # state_dict() / parameters() (checkpoints stay unchanged).
+        self.__dict__['_fused_map_cnn'] = None
+        # Column blocks of the fusion weight (map part, vector part) + bias, same deal
+        self.__dict__['_fusion_weight_split'] = None
+        
         # Calculate CNN output size
-        with torch.no_grad():
-            sample_map = torch.zeros(1, 3, 7, 7)
+        with torch.inference_mode():
+            sample_map = torch.zeros(1, *map_shape)
             cnn_output_size = self.map_cnn(sample_map).shape[1]
+        self.cnn_output_size = cnn_output_size
         
         # === MLP for vector features ===
         self.vector_mlp = nn.Sequential(
@@ -72,6 +91,70 @@ class PokemonCNNExtractor(BaseFeaturesExtractor):
             nn.Linear(combined_size, features_dim),
             nn.ReLU()
         )
+    
+    def fuse_for_inference(self) -> None:
+        """
+        Build the inference copy of map_cnn with every (Conv2d, BatchNorm2d)
+        pair folded into a single Conv2d, using the current BN running stats,
+        and split the fusion weight into its map / vector column blocks.
+        Must be called in eval mode.
+        
+        The training modules are left untouched; the fused copy is only used
+        while the extractor is in eval mode. Once built, later calls refresh
+        its weights in place so a compiled forward keeps the same module.
+        """
+        # May be reached from predict() under inference_mode; the copies must
+        # be normal tensors so later in-place refreshes stay legal
+        with torch.inference_mode(False):
+            self._fuse_for_inference()
+    
+    @torch.no_grad()
+    def _fuse_for_inference(self) -> None:
+        layers = []
+        modules = list(self.map_cnn)
+        i = 0
+        while i < len(modules):
+            module = modules[i]
+            next_module = modules[i + 1] if i + 1 < len(modules) else None
+            if isinstance(module, nn.Conv2d) and isinstance(next_module, nn.BatchNorm2d):
+                layers.append(fuse_conv_bn_eval(module, next_module))
+                i += 2
+            else:
+                layers.append(module)
+                i += 1
+        fused = nn.Sequential(*layers).eval()
+        if self.rollout_dtype is not None:
+            fused = fused.to(self.rollout_dtype)
+        
+        # Rebuild from scratch the first time or after the policy changed device
+        weight = self.fusion[0].weight
+        if self._fused_map_cnn is not None and self._fusion_weight_split[0].device != weight.device:
+            self.__dict__['_fused_map_cnn'] = None
+            self.__dict__['_fusion_weight_split'] = None
+        
+        if self._fused_map_cnn is None:
+            self.__dict__['_fused_map_cnn'] = fused
+        else:
+            for old, new in zip(self._fused_map_cnn, fused):
+                if isinstance(old, nn.Conv2d):
+                    old.weight.copy_(new.weight)
+                    old.bias.copy_(new.bias)
+        
+        # Split the fusion Linear into its map / vector column blocks so the
+        # inference forward can skip the torch.cat of both branches
+        split = (
+            weight[:, :self.cnn_output_size],
+            weight[:, self.cnn_output_size:],
+            self.fusion[0].bias,
+        )
+        if self._fusion_weight_split is None:
+            dtype = self.rollout_dtype or weight.dtype
+            self.__dict__['_fusion_weight_split'] = tuple(
+                t.to(dtype=dtype, copy=True, memory_format=torch.contiguous_format) for t in split
+            )
+        else:
+            for old, new in zip(self._fusion_weight_split, split):
+                old.copy_(new)
         
     def forward(self, observations: Dict[str, torch.Tensor]) -> torch.Tensor:
         """
@@ -84,18 +167,26 @@ class PokemonCNNExtractor(BaseFeaturesExtractor):
             Combined feature vector of size features_dim
         """
         # Extract observations
-        map_obs = observations['map']  # (batch, 7, 7, 3)
+        map_obs = observations['map']  # (batch, 3, 7, 7), uint8 obs scaled to [0, 1] by SB3
         vector_obs = observations['vector']  # (batch, 18)
         
-        # Transpose map from (batch, H, W, C) to (batch, C, H, W) for PyTorch CNN
-        map_obs = map_obs.permute(0, 3, 1, 2)
+        # Process vector with MLP
+        vector_features = self.vector_mlp(vector_obs)
+        
+        # Inference path: BN-folded CNN, fusion applied per branch (no concat)
+        if not self.training and self._fused_map_cnn is not None:
+            map_weight, vector_weight, bias = self._fusion_weight_split
+            if self.rollout_dtype is not None:
+                map_obs = map_obs.to(self.rollout_dtype)
+                vector_features = vector_features.to(self.rollout_dtype)
+            map_features = self._fused_map_cnn(map_obs)
+            output = F.linear(map_features, map_weight, bias)
+            output = output + F.linear(vector_features, vector_weight)
+            return F.relu(output).float()
         
         # Process map with CNN
         map_features = self.map_cnn(map_obs)
         
-        # Process vector with MLP
-        vector_features = self.vector_mlp(vector_obs)
-        
         # Combine features
         combined = torch.cat([map_features, vector_features], dim=1)
         
@@ -110,13 +201,57 @@ class PokemonCNNPolicy(ActorCriticPolicy):
     Custom ActorCritic policy with CNN feature extractor.
     """
     
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        compile_mode: Optional[str] = None,
+        rollout_dtype: Optional[torch.dtype] = None,
+        **kwargs
+    ):
+        """
+        Args:
+            compile_mode: Optional torch.compile mode for the feature
+                         extractor, e.g. "reduce-overhead" (None keeps eager).
+                         Compilation is lazy, so a toolchain problem only
+                         surfaces on the first forward - opt in explicitly.
+            rollout_dtype: Reduced precision for rollout/predict forwards,
+                          e.g. torch.bfloat16 (None keeps float32). Rollout
+                          log-probs then differ slightly from the float32
+                          training forward, so PPO's first-epoch ratio is no
+                          longer exactly 1 - keep off unless rollouts dominate.
+        """
         # Set the custom feature extractor
         kwargs['features_extractor_class'] = PokemonCNNExtractor
-        kwargs['features_extractor_kwargs'] = {'features_dim': 256}
+        kwargs['features_extractor_kwargs'] = {'features_dim': 256, 'rollout_dtype': rollout_dtype}
         
         # Call parent constructor
         super().__init__(*args, **kwargs)
+        
+        # The extractor is tiny (7x7 map, batch = n_envs during rollouts), so
+        # its cost is op dispatch / kernel launches rather than FLOPs.
+        # Module.compile() compiles in place, keeping state_dict keys and the
+        # pi/vf extractor references intact.
+        if compile_mode is not None:
+            self.features_extractor.compile(mode=compile_mode, dynamic=False)
+    
+    def predict(self, *args, **kwargs):
+        """
+        Same as ActorCriticPolicy.predict, but run under torch.inference_mode()
+        so no autograd bookkeeping is done for the forward.
+        """
+        with torch.inference_mode():
+            return super().predict(*args, **kwargs)
+    
+    def set_training_mode(self, mode: bool) -> None:
+        """
+        Put the policy in training or evaluation mode.
+        
+        Entering eval mode (rollout collection, predict) refreshes the CNN's
+        BN-folded inference copy from the current weights.
+        """
+        super().set_training_mode(mode)
+        if not mode:
+            self.features_extractor.fuse_for_inference()
 
 
 # For easy import
@@ -10,7 +10,8 @@ import logging
 from typing import Optional, Tuple, Dict, Any
 
 from pokemon_env.emulator import EmeraldEmulator
-from agent.lightweight_state_reader import LightweightStateReader
+from agent.lightweight_state_reader import DRL_STATE_DTYPE, LightweightStateReader
+from agent.reward_core import NUMBA_AVAILABLE, lightweight_reward
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,8 @@ class PokemonEmeraldEnv(gym.Env):
         max_steps: int = 10000,
         frame_skip: int = 36,  # Execute action for N frames (6 frames = 10 decisions/sec at 60fps)
         turbo_mode: bool = True,  # If True, runs emulator at max speed (no throttling)
-        state_read_interval: int = 1  # Read full game state every N steps (1=every step, 5=every 5 steps)
+        state_read_interval: int = 1,  # Read full game state every N steps (1=every step, 5=every 5 steps)
+        hard_reset: bool = False  # If True, reset() restores the initial state instead of continuing
     ):
         """
         Initialize the Pokemon Emerald DRL environment.
@@ -53,6 +55,9 @@ class PokemonEmeraldEnv(gym.Env):
             state_read_interval: Read full game state every N steps for speed
                        - 1 = read every step (slow but accurate)
                        - 5 = read every 5 steps (5x faster, slightly stale data)
+            hard_reset: Restore the initial save state on every reset() (from
+                       the in-memory copy, no disk I/O). Default is a soft
+                       reset that continues from the current position.
         """
         super().__init__()
         
@@ -63,55 +68,52 @@ class PokemonEmeraldEnv(gym.Env):
         self.frame_skip = frame_skip
         self.turbo_mode = turbo_mode
         self.state_read_interval = state_read_interval
+        self.hard_reset = hard_reset
         
         # Initialize emulator
-        logger.info(f"Initializing emulator with ROM: {rom_path}")
+        logger.info("Initializing emulator with ROM: %s", rom_path)
         self.emulator = EmeraldEmulator(rom_path=rom_path, headless=(render_mode != 'human'))
         self.emulator.initialize()
-        logger.info("Emulator initialized successfully")
+        logger.debug("Emulator initialized successfully")
         
         # Initialize lightweight state reader for fast observations
-        logger.info("Initializing lightweight state reader for DRL...")
+        logger.debug("Initializing lightweight state reader for DRL...")
         self.state_reader = LightweightStateReader(self.emulator.memory_reader)
-        logger.info("Lightweight reader ready")
+        logger.debug("Lightweight reader ready")
         
         # Load initial state ONCE - critical for training speed!
-        logger.info(f"Loading initial state from: {initial_state_path}")
+        logger.info("Loading initial state from: %s", initial_state_path)
         self.emulator.load_state(initial_state_path)
         # Now save it to memory so we can restore quickly
-        logger.info("Saving state to memory for fast resets...")
+        logger.debug("Saving state to memory for fast resets...")
         self.initial_state_bytes = self.emulator.save_state()
-        logger.info(f"State cached in memory: {len(self.initial_state_bytes)} bytes")
-        
-        # Get initial game state and cache it too
-        logger.info("Getting initial game state...")
-        self.initial_game_state = self.emulator.get_comprehensive_state()
-        logger.info(f"Initial game state cached")
+        logger.info("State cached in memory: %d bytes", len(self.initial_state_bytes))
         
         # Action space: 8 GBA buttons
         # 0=A, 1=B, 2=SELECT, 3=START, 4=RIGHT, 5=LEFT, 6=UP, 7=DOWN
         self.action_space = spaces.Discrete(8)
         
-        self._action_map = {
-            0: "a",
-            1: "b", 
-            2: "select",
-            3: "start",
-            4: "right",
-            5: "left",
-            6: "up",
-            7: "down"
-        }
+        # Indexed by action (tuple index instead of a dict hash per step)
+        self._action_map = (
+            "a",       # 0
+            "b",       # 1
+            "select",  # 2
+            "start",   # 3
+            "right",   # 4
+            "left",    # 5
+            "up",      # 6
+            "down",    # 7
+        )
         
         # Observation space: Dictionary with map image and game state vector
-        # Map: 7x7x3 channels (metatile_id, collision, behavior) - for CNN
+        # Map: 3x7x7 channels-first (metatile_id, behavior, collision) - for CNN
         # Vector: player position (2) + party info (12) + game state (4) = 18 features
         self.observation_space = spaces.Dict({
             'map': spaces.Box(
                 low=0,
-                high=1.0,
-                shape=(7, 7, 3),  # Height x Width x Channels
-                dtype=np.float32
+                high=255,
+                shape=(3, 7, 7),  # Channels x Height x Width
+                dtype=np.uint8  # Raw uint8 tiles, SB3 divides by 255 before the CNN
             ),
             'vector': spaces.Box(
                 low=-1.0,
@@ -122,18 +124,23 @@ class PokemonEmeraldEnv(gym.Env):
         })
         
         # Internal state tracking
-        self.prev_game_state = None
+        self.prev_state_record = np.zeros((), dtype=DRL_STATE_DTYPE)
         self.current_step = 0
         self.episode_reward = 0.0
-        self.cached_game_state = None  # Cache for state_read_interval optimization
+        self.cached_game_state = None  # (observation, record) for state_read_interval
+        self._hard_reset_cache = None  # private (observation, record) after a hard reset
         
         # Tracking for reward calculation
-        self.prev_location = None
-        self.visited_locations = set()
         self.prev_position = None
         self.stationary_steps = 0
         
-        logger.info(f"Environment created - Action space: {self.action_space}, Observation space: {self.observation_space.shape}")
+        if NUMBA_AVAILABLE:
+            # Compile (or load from cache) the reward kernel now so the first
+            # step isn't slow
+            self._calculate_reward_from_lightweight(self.prev_state_record, self.prev_state_record)
+            self.stationary_steps = 0
+        
+        logger.debug("Environment created - Action space: %s, Observation space: %s", self.action_space, self.observation_space)
     
     def reset(
         self,
@@ -153,33 +160,44 @@ class PokemonEmeraldEnv(gym.Env):
         """
         super().reset(seed=seed)
         
-        # Get lightweight state for fast reset
-        logger.info(f"Resetting environment - Episode complete")
-        lightweight_state = self.state_reader.get_drl_state(map_radius=3)
-        self.prev_game_state = lightweight_state
-        logger.info(f"Reset complete - soft reset (continuing from current position)")
+        # Hard reset restores the initial state from the bytes cached in
+        # __init__; soft reset just continues from the current position.
+        # Per-episode progress goes to DEBUG so it costs nothing when
+        # training at the default log level.
+        if self.hard_reset:
+            self.emulator.load_state(state_bytes=self.initial_state_bytes)
+            self.state_reader.invalidate_cache()
+            # Every hard reset lands on the same state, so read it once into
+            # a private copy and hand out copies of that (including the first
+            # time - the reader's buffers are refilled by the next read)
+            if self._hard_reset_cache is None:
+                observation, state_record = self.state_reader.get_obs_and_record(map_radius=3)
+                self._hard_reset_cache = (self._copy_observation(observation), state_record.copy())
+            cached_observation, cached_record = self._hard_reset_cache
+            observation = self._copy_observation(cached_observation)
+            state_record = cached_record.copy()
+        else:
+            # One memory read for both the observation and the state
+            observation, state_record = self.state_reader.get_obs_and_record(map_radius=3)
+            observation = self._copy_observation(observation)
+        self.prev_state_record = state_record
+        self.cached_game_state = (observation, state_record)
         
         # Reset tracking variables
-        logger.info("Resetting tracking variables...")
         self.current_step = 0
         self.episode_reward = 0.0
-        position = lightweight_state.get('position', {})
-        self.prev_position = (position.get('x', 0), position.get('y', 0))
+        self.prev_position = (int(state_record['x']), int(state_record['y']))
         self.stationary_steps = 0
-        logger.info(f"Initial position: {self.prev_position}")
-        
-        # Extract observation using lightweight reader
-        logger.info("Extracting observation...")
-        observation = self.state_reader.get_observation_for_drl(map_radius=3)
-        logger.info(f"Observation extracted - Map shape: {observation['map'].shape}, Vector shape: {observation['vector'].shape}")
         
         info = {
             'location': 'Unknown',
-            'badges': lightweight_state.get('badges', 0),
-            'party_size': len(lightweight_state.get('party', []))
+            'badges': int(state_record['badges']),
+            'party_size': int(state_record['party_count'])
         }
         
-        logger.info(f"Environment reset - Party size: {info['party_size']}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Environment reset (%s) - position: %s, party size: %d",
+                         "hard" if self.hard_reset else "soft", self.prev_position, info['party_size'])
         
         return observation, info
     
@@ -194,7 +212,11 @@ class PokemonEmeraldEnv(gym.Env):
             action: Action index (0-7)
             
         Returns:
-            observation: New observation
+            observation: New observation. Its arrays are reused by later
+                         steps (see LightweightStateReader.get_obs_and_record),
+                         except on the step that ends the episode, which
+                         returns a private copy (VecEnv keeps it as
+                         terminal_observation across reset())
             reward: Reward for this step
             terminated: Whether episode ended naturally
             truncated: Whether episode was cut off
@@ -207,332 +229,104 @@ class PokemonEmeraldEnv(gym.Env):
         total_reward = 0.0
         
         # Repeat action for frame_skip frames (Atari-style)
-        for _ in range(self.frame_skip):
-            self.emulator.run_frame_with_buttons([button])
-        
-        # Get lightweight observation directly (much faster than get_comprehensive_state!)
-        observation = self.state_reader.get_observation_for_drl(map_radius=3)
-        
-        # For reward calculation, we still need some game state info
-        # But we can get it from the lightweight reader
-        lightweight_state = self.state_reader.get_drl_state(map_radius=3)
+        self._advance_frames(button, self.frame_skip)
+        
+        # Only read game state every state_read_interval steps; in between,
+        # repeat the cached observation and give no reward (nothing new was
+        # observed, and re-scoring the same state would count as standing still)
+        if (self.state_read_interval <= 1
+                or self.cached_game_state is None
+                or self.current_step % self.state_read_interval == 0):
+            # Get lightweight observation directly (much faster than get_comprehensive_state!)
+            # The same read also provides the state used for reward calculation
+            observation, state_record = self.state_reader.get_obs_and_record(map_radius=3)
+            self.cached_game_state = (observation, state_record)
+            
+            # Calculate reward using lightweight state
+            reward = self._calculate_reward_from_lightweight(self.prev_state_record, state_record)
+            
+            # Check termination conditions
+            terminated = self._check_terminated_from_lightweight(state_record)
+            
+            # Update previous state
+            self.prev_state_record = state_record
+        else:
+            observation, state_record = self.cached_game_state
+            reward = 0.0
+            terminated = False
         
-        # Calculate reward using lightweight state
-        reward = self._calculate_reward_from_lightweight(self.prev_game_state, lightweight_state)
         self.episode_reward += reward
-        
-        # Check termination conditions
-        terminated = self._check_terminated_from_lightweight(lightweight_state)
         truncated = self.current_step >= self.max_steps
+        if terminated or truncated:
+            # The only observation that outlives the next read
+            observation = self._copy_observation(observation)
         
         # Prepare info
         info = {
             'location': 'Unknown',  # Location reading is slow, skip for now
-            'badges': lightweight_state.get('badges', 0),
+            'badges': int(state_record['badges']),
             'step': self.current_step,
             'episode_reward': self.episode_reward,
             'action_taken': button,
             'frames_executed': self.frame_skip
         }
         
-        # Update previous state
-        self.prev_game_state = lightweight_state
-        
         return observation, reward, terminated, truncated, info
     
-    def _extract_observation(self, game_state: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    @staticmethod
+    def _copy_observation(observation: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """
-        Convert game state to observation for the agent.
+        Copy an observation out of the reader's reused buffers.
         
-        Returns a dictionary with:
-        - 'map': 7x7x3 array for CNN (metatile_id, collision, behavior)
-        - 'vector': 18-element vector (position, party, game state)
+        Used for reset() and the last step of an episode: VecEnvs keep that
+        step's observation as info["terminal_observation"] and then call
+        reset(), which would otherwise overwrite it.
         """
-        player = game_state.get('player', {})
-        position = player.get('position', {})
-        
-        # === Extract map as 7x7x3 image for CNN ===
-        map_data = game_state.get('map', {})
-        tiles = map_data.get('tiles', [])
-        
-        # Initialize 7x7x3 map array
-        map_array = np.zeros((7, 7, 3), dtype=np.float32)
-        
-        if tiles and len(tiles) > 0:
-            # Get center 7x7 from the full tile grid
-            center_i = len(tiles) // 2
-            center_j = len(tiles[0]) // 2 if len(tiles) > 0 else 0
-            start_i = max(0, center_i - 3)
-            start_j = max(0, center_j - 3)
-            
-            for i in range(7):
-                for j in range(7):
-                    tile_i = start_i + i
-                    tile_j = start_j + j
-                    
-                    if tile_i < len(tiles) and tile_j < len(tiles[tile_i]):
-                        tile = tiles[tile_i][tile_j]
-                        if tile and len(tile) >= 3:
-                            # Channel 0: metatile_id (normalized)
-                            map_array[i, j, 0] = tile[0] / 1000.0
-                            
-                            # Channel 1: behavior (extract value from enum if needed)
-                            behavior = tile[1]
-                            if hasattr(behavior, 'value'):
-                                behavior_val = behavior.value
-                            else:
-                                behavior_val = int(behavior) if behavior is not None else 0
-                            map_array[i, j, 1] = behavior_val / 255.0
-                            
-                            # Channel 2: collision (0 or 1)
-                            map_array[i, j, 2] = float(tile[2])
-        
-        # === Extract vector features (18 total) ===
-        vector_features = []
-        
-        # Player position (2 features)
-        vector_features.append(position.get('x', 0) / 100.0)
-        vector_features.append(position.get('y', 0) / 100.0)
-        
-        # Party Pokemon (12 features: 6 Pokemon x 2 values)
-        party = player.get('party', [])
-        for i in range(6):
-            if i < len(party):
-                pokemon = party[i]
-                vector_features.append(pokemon.get('level', 0) / 100.0)
-                current_hp = pokemon.get('current_hp', 0)
-                max_hp = pokemon.get('max_hp', 1)
-                hp_ratio = current_hp / max(max_hp, 1)
-                vector_features.append(hp_ratio)
-            else:
-                vector_features.extend([0.0, 0.0])
-        
-        # Game state (4 features)
-        game = game_state.get('game', {})
-        vector_features.append(min(game.get('money', 0) / 999999.0, 1.0))
-        
-        # Handle badges - can be int or list
-        badges = game.get('badges', 0)
-        if isinstance(badges, list):
-            badge_count = sum(1 for b in badges if b)
-        else:
-            badge_count = int(badges) if isinstance(badges, (int, float)) else 0
-        vector_features.append(badge_count / 8.0)
-        
-        vector_features.append(1.0 if game.get('is_in_battle', False) else 0.0)
-        vector_features.append(min(game.get('pokedex_caught', 0) / 200.0, 1.0))
-        
-        return {
-            'map': map_array,
-            'vector': np.array(vector_features, dtype=np.float32)
-        }
+        return {key: value.copy() for key, value in observation.items()}
     
-    def _calculate_reward(
-        self,
-        prev_state: Dict[str, Any],
-        current_state: Dict[str, Any]
-    ) -> float:
-        """
-        Calculate reward based on state transition.
-        """
-        reward = 0.0
-        
-        # Check if game is in a "blocked" state (dialogue, cutscene, etc.)
-        # In these states, player can't move, so don't penalize
-        is_blocked = self._is_game_blocked(current_state)
-        
-        # Badge rewards (primary objective)
-        prev_badges = self._get_badges(prev_state)
-        curr_badges = self._get_badges(current_state)
-        if curr_badges > prev_badges:
-            reward += 1000.0
-            logger.info(f"🏆 Badge obtained! Total badges: {curr_badges}")
-        
-        # Level up rewards
-        prev_levels = self._get_total_party_level(prev_state)
-        curr_levels = self._get_total_party_level(current_state)
-        if curr_levels > prev_levels:
-            reward += 50.0
-        
-        # Location exploration rewards
-        curr_location = self._get_location(current_state)
-        if curr_location != self.prev_location:
-            if curr_location not in self.visited_locations:
-                reward += 20.0
-                self.visited_locations.add(curr_location)
-            else:
-                reward += 5.0
-            self.prev_location = curr_location
-        
-        # Movement rewards (only if not blocked)
-        curr_position = self._get_position(current_state)
-        if not is_blocked:
-            if curr_position != self.prev_position:
-                reward += 0.5
-                self.stationary_steps = 0
-            else:
-                self.stationary_steps += 1
-                # Penalize being stuck, but less harshly at first
-                reward -= 0.05 * min(self.stationary_steps, 20)
-        else:
-            # In blocked state, reset stationary counter
-            self.stationary_steps = 0
-        
-        self.prev_position = curr_position
-        
-        # HP penalties (only if not in blocked state to avoid unfair penalties during battles/cutscenes)
-        if not is_blocked:
-            party = current_state.get('player', {}).get('party', [])
-            for pokemon in party:
-                current_hp = pokemon.get('current_hp', 0)
-                max_hp = pokemon.get('max_hp', 1)
-                hp_ratio = current_hp / max(max_hp, 1)
-                if hp_ratio < 0.2:
-                    reward -= 5.0
-                elif hp_ratio < 0.5:
-                    reward -= 1.0
-        
-        return reward
-    
-    def _is_game_blocked(self, game_state: Dict[str, Any]) -> bool:
-        """
-        Check if the game is in a state where player input is blocked.
-        This includes dialogues, cutscenes, menus, etc.
-        """
-        game = game_state.get('game_state', {})
-        
-        # Check for dialogue
-        if game.get('in_dialogue', False):
-            return True
-        
-        # Check for battle (partially blocked - different action space)
-        if game.get('is_in_battle', False):
-            return True
-        
-        # Check for menu
-        if game.get('in_menu', False):
-            return True
-        
-        # Could add more checks:
-        # - Animations playing
-        # - Cutscenes
-        # - Scrolling text
-        # For now, these three are the main ones
-        
-        return False
-    
-    def _check_terminated(self, game_state: Dict[str, Any]) -> bool:
-        """Check if episode should terminate."""
-        party = game_state.get('player', {}).get('party', [])
-        if party:
-            all_fainted = all(p.get('current_hp', 0) == 0 for p in party)
-            if all_fainted:
-                return True
-        
-        badges = self._get_badges(game_state)
-        if badges >= 8:
-            return True
-        
-        return False
-    
-    def _get_position(self, game_state: Dict[str, Any]) -> Tuple[int, int]:
-        """Get player position as tuple."""
-        pos = game_state.get('player', {}).get('position', {})
-        return (pos.get('x', 0), pos.get('y', 0))
-    
-    def _get_location(self, game_state: Dict[str, Any]) -> str:
-        """Get current location name."""
-        location = game_state.get('player', {}).get('location', '')
-        if isinstance(location, dict):
-            return location.get('map_name', 'UNKNOWN')
-        return str(location) if location else 'UNKNOWN'
-    
-    def _get_badges(self, game_state: Dict[str, Any]) -> int:
-        """Get number of badges."""
-        badges = game_state.get('game', {}).get('badges', 0)
-        if isinstance(badges, list):
-            return sum(1 for b in badges if b)
-        return int(badges) if isinstance(badges, int) else 0
-    
-    def _get_total_party_level(self, game_state: Dict[str, Any]) -> int:
-        """Get sum of all party Pokemon levels."""
-        party = game_state.get('player', {}).get('party', [])
-        return sum(p.get('level', 0) for p in party)
+    def _advance_frames(self, button: str, n: int) -> None:
+        """Advance the emulator n frames holding a single button."""
+        self.emulator.run_frames_with_button(button, n)
     
     # === Lightweight methods for fast DRL training ===
     
     def _calculate_reward_from_lightweight(
         self,
-        prev_state: Dict[str, Any],
-        current_state: Dict[str, Any]
+        prev_state: np.ndarray,
+        current_state: np.ndarray
     ) -> float:
         """
         Calculate reward based on lightweight state (faster than full state).
         Simplified reward function that doesn't require expensive state reads.
-        """
-        reward = 0.0
-        
-        # Badge rewards (primary objective)
-        prev_badges = prev_state.get('badges', 0) if prev_state else 0
-        curr_badges = current_state.get('badges', 0)
-        if curr_badges > prev_badges:
-            reward += 1000.0
-            logger.info(f"🏆 Badge obtained! Total badges: {curr_badges}")
-        
-        # Level up rewards
-        prev_party = prev_state.get('party', []) if prev_state else []
-        curr_party = current_state.get('party', [])
-        prev_levels = sum(p.get('level', 0) for p in prev_party)
-        curr_levels = sum(p.get('level', 0) for p in curr_party)
-        if curr_levels > prev_levels:
-            reward += 50.0
-        
-        # Movement rewards
-        prev_pos = prev_state.get('position', {}) if prev_state else {}
-        curr_pos = current_state.get('position', {})
-        prev_coords = (prev_pos.get('x', 0), prev_pos.get('y', 0))
-        curr_coords = (curr_pos.get('x', 0), curr_pos.get('y', 0))
-        
-        # Check if in battle (movement doesn't matter in battle)
-        in_battle = current_state.get('in_battle', False)
-        
-        if not in_battle:
-            if curr_coords != prev_coords:
-                reward += 0.5
-                self.stationary_steps = 0
-            else:
-                self.stationary_steps += 1
-                # Penalize being stuck
-                reward -= 0.05 * min(self.stationary_steps, 20)
-        else:
-            # In battle, reset stationary counter
-            self.stationary_steps = 0
         
-        # HP penalties (only if not in battle)
-        if not in_battle:
-            for pokemon in curr_party:
-                current_hp = pokemon.get('current_hp', 0)
-                max_hp = pokemon.get('max_hp', 1)
-                hp_ratio = current_hp / max(max_hp, 1)
-                if hp_ratio < 0.2:
-                    reward -= 5.0
-                elif hp_ratio < 0.5:
-                    reward -= 1.0
-        
-        return reward
+        Args:
+            prev_state, current_state: DRL_STATE_DTYPE records
+        """
+        curr_badges = int(current_state['badges'])
+        if curr_badges > prev_state['badges']:
+            logger.info("🏆 Badge obtained! Total badges: %d", curr_badges)
+        
+        reward, self.stationary_steps = lightweight_reward(
+            int(prev_state['badges']), int(prev_state['level'].sum()),
+            int(prev_state['x']), int(prev_state['y']),
+            curr_badges, int(current_state['level'].sum()),
+            int(current_state['x']), int(current_state['y']),
+            bool(current_state['in_battle']),
+            current_state['hp'], current_state['max_hp'],
+            int(current_state['party_count']),
+            self.stationary_steps,
+        )
+        return float(reward)
     
-    def _check_terminated_from_lightweight(self, lightweight_state: Dict[str, Any]) -> bool:
-        """Check if episode should terminate using lightweight state."""
+    def _check_terminated_from_lightweight(self, state: np.ndarray) -> bool:
+        """Check if episode should terminate using a DRL_STATE_DTYPE record."""
         # Check if all Pokemon fainted
-        party = lightweight_state.get('party', [])
-        if party:
-            all_fainted = all(p.get('current_hp', 0) == 0 for p in party)
-            if all_fainted:
-                return True
+        party_count = int(state['party_count'])
+        if party_count and not state['hp'][:party_count].any():
+            return True
         
         # Check if got all badges
-        badges = lightweight_state.get('badges', 0)
-        if badges >= 8:
+        if state['badges'] >= 8:
             return True
         
         return False
@@ -542,20 +336,22 @@ class PokemonEmeraldEnv(gym.Env):
     def render(self):
         """Render the environment.
         
+        Returns a copy of the current frame as a (160, 240, 3) uint8 array,
+        or None when no render_mode was requested or the emulator has no
+        frame (core or video buffer missing). Per-frame consumers that
+        only draw the frame can read the zero-copy view from
+        EmeraldEmulator.get_framebuffer_array instead, as the render
+        callback in train_ppo.py does.
+        
         Note: For training with visualization, use PygameRenderCallback in train_ppo.py
         instead of calling this method directly. This avoids the PIL.Image.show() 
         issue which spawns external processes and causes system resource exhaustion.
         """
-        if self.render_mode == 'human':
+        if self.render_mode in ('human', 'rgb_array'):
             # Don't use screenshot.show() - it spawns external processes
-            # Instead, return the screenshot for external rendering (e.g., pygame)
-            screenshot = self.emulator.get_screenshot()
-            if screenshot:
-                return np.array(screenshot)
-        elif self.render_mode == 'rgb_array':
-            screenshot = self.emulator.get_screenshot()
-            if screenshot:
-                return np.array(screenshot)
+            # Instead, return the frame for external rendering (e.g., pygame)
+            frame = self.emulator.get_framebuffer_array()
+            return None if frame is None else frame.copy()
         return None
     
     def close(self):
@@ -3,10 +3,22 @@ Fast lightweight state reader for DRL training
 Only reads the minimal data needed for observations (not the full game state)
 """
 
-from typing import Dict, Any, Tuple
+import struct
+from typing import Dict, Any, Optional, Tuple
 import numpy as np
 
 
+PARTY_ADDR = 0x02024284
+PARTY_MAX = 6
+PARTY_MON_SIZE = 100
+
+_POSITION = struct.Struct('<BB')
+_MONEY_BADGES = struct.Struct('<I8xH')
+# Party count, then per 100-byte slot: level (+0x38), current_hp (+0x56),
+# max_hp (+0x58)
+_PARTY = struct.Struct('<B3x' + '56xB29xHH10x' * PARTY_MAX)
+
+
 def get_fast_observation_data(memory_reader) -> Dict[str, Any]:
     """
     Read ONLY the data needed for DRL observations (much faster than get_comprehensive_state)
@@ -15,50 +27,106 @@ def get_fast_observation_data(memory_reader) -> Dict[str, Any]:
     - position: (x, y)
     - tiles: 7x7 local map
     - party: Basic party info (levels, HP)
+    - party_levels, party_hp, party_maxhp: the same as length-6 arrays
+      (zero past party_count)
     - badges: Badge count
     - money: Money
     - in_battle: Boolean
     """
-    # Read player position (fast - just 2 bytes)
-    x = memory_reader.read_byte(0x02037318)  # X position
-    y = memory_reader.read_byte(0x02037319)  # Y position
+    return _parse_blocks(*_read_blocks(memory_reader))
+
+
+def _read_blocks(memory_reader) -> Tuple[bytes, bytes, bytes, bytes]:
+    """
+    One bulk read_memory() call per block (position, party, money/badges,
+    battle flag) instead of one FFI round trip per field.
+    """
+    return (
+        memory_reader.read_memory(0x02037318, 2),
+        memory_reader.read_memory(PARTY_ADDR, 4 + PARTY_MAX * PARTY_MON_SIZE),
+        memory_reader.read_memory(0x020244E0, _MONEY_BADGES.size),
+        memory_reader.read_memory(0x02022B4C, 1),
+    )
+
+
+def _parse_blocks(position_buf: bytes, party_buf: bytes, money_badges_buf: bytes,
+                  battle_buf: bytes) -> Dict[str, Any]:
+    """Decode the blocks from _read_blocks() with struct.unpack_from."""
+    # Read player position (2 bytes)
+    x, y = _POSITION.unpack_from(position_buf)
     
     # Read local 7x7 map (medium speed - need to extract tiles)
     # For now, get minimal tile data
     tiles = []  # TODO: Implement fast tile reading
     
-    # Read party size (1 byte)
-    party_count = memory_reader.read_byte(0x02024284)
+    # Read party size + party Pokemon data (only what we need: level, HP)
+    # in one unpack: (party_count, level, current_hp, max_hp, level, ...)
+    fields = _PARTY.unpack_from(party_buf)
+    party_count = fields[0]
+    
+    # Structure-of-arrays over the 6 party slots, zeroed past party_count
+    filled = min(party_count, PARTY_MAX)
+    slots = np.zeros((PARTY_MAX, 3), dtype=np.uint16)
+    slots[:filled] = np.array(fields[1:1 + 3 * filled], dtype=np.uint16).reshape(filled, 3)
+    party_levels = slots[:, 0].astype(np.uint8)
+    party_hp = slots[:, 1]
+    party_maxhp = slots[:, 2]
     
-    # Read party Pokemon data (only what we need: level, HP)
     party = []
-    for i in range(min(party_count, 6)):
-        offset = 0x02024284 + 4 + (i * 100)  # Party structure offset
-        level = memory_reader.read_byte(offset + 0x38)
-        current_hp = memory_reader.read_word(offset + 0x56)
-        max_hp = memory_reader.read_word(offset + 0x58)
+    for i in range(filled):
+        level, current_hp, max_hp = fields[1 + 3 * i:4 + 3 * i]
         party.append({
             'level': level,
             'current_hp': current_hp,
             'max_hp': max_hp
         })
     
-    # Read badges (2 bytes)
-    badges_raw = memory_reader.read_word(0x020244EC)
-    badge_count = bin(badges_raw).count('1')
-    
-    # Read money (4 bytes)
-    money = memory_reader.read_dword(0x020244E0)
+    # Read money (4 bytes at +0) and badges (2 bytes at +0xC)
+    money, badges_raw = _MONEY_BADGES.unpack_from(money_badges_buf)
+    badge_count = badges_raw.bit_count()
     
     # Read battle flag (1 byte)
-    in_battle = memory_reader.read_byte(0x02022B4C) != 0
+    in_battle = battle_buf[0] != 0
     
     return {
         'position': (x, y),
         'tiles': tiles,  # Empty for now - can optimize later
         'party': party,
+        'party_levels': party_levels,
+        'party_hp': party_hp,
+        'party_maxhp': party_maxhp,
         'badges': badge_count,
         'money': money,
         'in_battle': in_battle,
         'party_count': party_count
     }
+
+
+class FastObservationReader:
+    """
+    get_fast_observation_data() for one memory reader, reusing the last
+    parse while the raw memory blocks are unchanged (standing still,
+    animations, scrolling text).
+    """
+    
+    def __init__(self, memory_reader):
+        self.mem = memory_reader
+        # Raw bytes of the last read and what they parsed to
+        self._last_key: Optional[bytes] = None
+        self._last_parsed: Optional[Dict[str, Any]] = None
+    
+    def get_observation_data(self) -> Dict[str, Any]:
+        """
+        Same dict as get_fast_observation_data(). Every call returns a new
+        dict (and party list); the party arrays are shared between calls
+        with unchanged memory, so they are read-only.
+        """
+        blocks = _read_blocks(self.mem)
+        key = b"".join(blocks)
+        if key != self._last_key:
+            parsed = _parse_blocks(*blocks)
+            for name in ('party_levels', 'party_hp', 'party_maxhp'):
+                parsed[name].setflags(write=False)
+            self._last_key, self._last_parsed = key, parsed
+        parsed = self._last_parsed
+        return dict(parsed, party=[dict(pokemon) for pokemon in parsed['party']])
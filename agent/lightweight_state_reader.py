@@ -2,9 +2,130 @@
 Lightweight state reader for DRL training - reads ONLY what's needed for observations.
 This dramatically reduces memory read overhead compared to get_comprehensive_state().
 """
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+import logging
 import numpy as np
 
+from pokemon_env.enums import StatusCondition
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logging.debug("numba not available - map channels filled with NumPy")
+
+
+# Party slots read by the lightweight reader (see get_drl_state)
+PARTY_SLOTS = 3
+
+# (species_id, level, current_hp, max_hp, status) stored for an empty party
+# slot, by both drl_state_to_record() and get_obs_and_record()
+_EMPTY_SLOT = (0, 0, 0, 0, 0)
+
+# Status bits that make StatusCondition.get_status_name() something other
+# than "OK" (bit 7, bad poison, on its own still reads as OK)
+_NOT_OK_STATUS = (StatusCondition.SLEEP_MASK | StatusCondition.POISON | StatusCondition.BURN
+                  | StatusCondition.FREEZE | StatusCondition.PARALYSIS)
+
+# Fixed-layout record of the fields used for reward / termination, so the
+# env can do array math instead of chasing nested dicts every step
+DRL_STATE_DTYPE = np.dtype([
+    ('x', np.int32),
+    ('y', np.int32),
+    ('badges', np.uint8),
+    ('in_battle', np.bool_),
+    ('party_count', np.uint8),
+    ('hp', np.uint16, (PARTY_SLOTS,)),
+    ('max_hp', np.uint16, (PARTY_SLOTS,)),
+    ('level', np.uint8, (PARTY_SLOTS,)),
+])
+
+
+def drl_state_to_record(state: Dict[str, Any]) -> np.ndarray:
+    """
+    Pack a get_drl_state() dict into a 0-d DRL_STATE_DTYPE record.
+    Missing values (failed reads) are left at 0; empty party slots hold
+    _EMPTY_SLOT.
+    """
+    record = np.zeros((), dtype=DRL_STATE_DTYPE)
+    position = state.get("position")
+    if position:
+        record["x"] = position.get("x", 0)
+        record["y"] = position.get("y", 0)
+    record["badges"] = state.get("badges", 0)
+    record["in_battle"] = bool(state.get("in_battle", False))
+    
+    party = state.get("party", [])[:PARTY_SLOTS]
+    record["party_count"] = len(party)
+    hp, max_hp, level = record["hp"], record["max_hp"], record["level"]
+    for i, pokemon in enumerate(party):
+        hp[i] = pokemon.get("current_hp", 0)
+        max_hp[i] = pokemon.get("max_hp", 1)
+        level[i] = pokemon.get("level", 0)
+    _, empty_level, empty_hp, empty_max_hp, _ = _EMPTY_SLOT
+    hp[len(party):] = empty_hp
+    max_hp[len(party):] = empty_max_hp
+    level[len(party):] = empty_level
+    return record
+
+
+def tiles_to_array(tiles: List[List[Tuple]]) -> np.ndarray:
+    """
+    Convert a map tile grid (rows of (metatile_id, behavior, collision, ...)
+    tuples, or the array from read_map_around_player(as_array=True)) into an
+    int32 array of shape (H, W, 3). Ragged rows, short tiles and None values
+    are zero-filled.
+    """
+    try:
+        # Fast path: rectangular grid of int / IntEnum tuples in one C call
+        arr = np.asarray(tiles, dtype=np.int32)
+        if arr.ndim == 3 and arr.shape[2] >= 3:
+            return arr[:, :, :3]
+    except (TypeError, ValueError):
+        pass
+    
+    # Slow path: irregular data
+    height = len(tiles)
+    width = max((len(row) for row in tiles), default=0)
+    arr = np.zeros((height, width, 3), dtype=np.int32)
+    for i, row in enumerate(tiles):
+        for j, tile in enumerate(row):
+            if tile and len(tile) >= 3:
+                arr[i, j] = [int(v) if v is not None else 0 for v in tile[:3]]
+    return arr
+
+
+def fill_map_channels(map_array: np.ndarray, tiles: np.ndarray) -> None:
+    """
+    Quantize an (H, W, 3) tile array into the uint8 channels-first map
+    observation (top-left aligned, cells beyond the tiles are left as-is):
+    
+    - channel 0: metatile_id >> 2 (ids are < 1024, so this fits 0..255)
+    - channel 1: behavior (0..255)
+    - channel 2: collision, 0 or 255
+    
+    The policy scales uint8 image observations to [0, 1] on-device.
+    """
+    if NUMBA_AVAILABLE:
+        _fill_map_channels_jit(map_array, tiles)
+        return
+    h, w = tiles.shape[:2]
+    map_array[0, :h, :w] = np.minimum(tiles[:, :, 0] >> 2, 255)
+    map_array[1, :h, :w] = np.minimum(tiles[:, :, 1], 255)
+    map_array[2, :h, :w] = np.where(tiles[:, :, 2] != 0, 255, 0)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _fill_map_channels_jit(map_array, tiles):
+        """fill_map_channels as one fused loop (no NumPy temporaries)"""
+        for i in range(tiles.shape[0]):
+            for j in range(tiles.shape[1]):
+                map_array[0, i, j] = min(tiles[i, j, 0] >> 2, 255)
+                map_array[1, i, j] = min(tiles[i, j, 1], 255)
+                map_array[2, i, j] = 255 if tiles[i, j, 2] != 0 else 0
+
 
 class LightweightStateReader:
     """Minimal state reader for DRL environment - fast but limited functionality"""
@@ -15,6 +136,73 @@ class LightweightStateReader:
             memory_reader: The full MemoryReader instance for fallback
         """
         self.mem = memory_reader
+        # Tile grid from the last get_drl_state() read, as an (H, W, 3) int32
+        # array (metatile_id, behavior, collision); see get_map_window
+        self._tile_buf = np.zeros((0, 0, 3), dtype=np.int32)
+        # map_radius -> observation dict reused by get_obs_and_state
+        self._obs_buffers: Dict[int, Dict[str, np.ndarray]] = {}
+        # (frame_counter, map_radius) of the last _read() and what it
+        # returned; game memory only changes when a frame runs
+        self._cached_key: Optional[Tuple[int, int]] = None
+        self._cached_reads: Optional[Tuple] = None
+    
+    def invalidate_cache(self) -> None:
+        """
+        Drop the cached memory reads. Call after loading a save state, which
+        rewrites memory without necessarily advancing the frame counter past
+        the cached one.
+        """
+        self._cached_key = None
+        self._cached_reads = None
+    
+    def _read(self, map_radius: int) -> Tuple:
+        """
+        Do the memory reads behind get_drl_state() and get_obs_and_record(),
+        and refresh self._tile_buf.
+        
+        Repeated calls within the same emulator frame return the cached
+        result without touching memory.
+        
+        Returns:
+            (coords, tiles, party, badges, in_battle) - party holds
+            read_party_basics() tuples; failed reads keep their defaults
+            (None, None, [], 0, False)
+        """
+        key = (self.mem.core.frame_counter, map_radius)
+        if key == self._cached_key:
+            return self._cached_reads
+        
+        coords, tiles, party, badges, in_battle = None, None, [], 0, False
+        self._tile_buf = np.zeros((0, 0, 3), dtype=np.int32)
+        try:
+            # 1. Position - fast, always works
+            coords = self.mem.read_coordinates()
+            
+            # 2. Map tiles - read smaller radius for speed, as an (H, W, 4)
+            # array so there are no per-tile tuples to convert
+            tiles = self.mem.read_map_around_player(radius=map_radius, as_array=True)
+            if len(tiles):
+                self._tile_buf = tiles_to_array(tiles)
+            else:
+                tiles = None
+            
+            # 3. Party Pokemon - minimal info only, straight from the party
+            # block (only first 3 Pokemon for speed)
+            party = self.mem.read_party_basics(PARTY_SLOTS)
+            
+            # 4. Badges - just count (always an int, no list to normalize)
+            badges = self.mem.read_badge_count()
+            
+            # 5. Battle flag - quick check
+            in_battle = self.mem.is_in_battle()
+            
+        except Exception:
+            # Fail silently, return partial state
+            pass
+        
+        self._cached_key = key
+        self._cached_reads = (coords, tiles, party, badges, in_battle)
+        return self._cached_reads
     
     def get_drl_state(self, map_radius: int = 3) -> Dict[str, Any]:
         """
@@ -39,111 +227,186 @@ class LightweightStateReader:
         Returns:
             Dict with keys: position, map_tiles, party, badges, in_battle
         """
-        state = {
-            "position": None,
-            "map_tiles": None,
-            "party": [],
-            "badges": 0,
-            "in_battle": False
+        coords, tiles, party, badges, in_battle = self._read(map_radius)
+        return {
+            "position": {"x": coords[0], "y": coords[1]} if coords is not None else None,
+            "map_tiles": tiles,
+            "party": [
+                {
+                    "species_id": species_id,
+                    "level": level,
+                    "current_hp": current_hp,
+                    "max_hp": max_hp,
+                    "status": StatusCondition(status).get_status_name() if status else "OK"
+                }
+                for species_id, level, current_hp, max_hp, status in party
+            ],
+            "badges": badges,
+            "in_battle": in_battle
         }
+    
+    def get_map_window(self, map_radius: int = 3, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Map observation from the tiles of the last memory read,
+        sliced straight out of the reader's tile array.
         
-        try:
-            # 1. Position - fast, always works
-            coords = self.mem.read_coordinates()
-            state["position"] = {"x": coords[0], "y": coords[1]}
-            
-            # 2. Map tiles - read smaller radius for speed
-            tiles = self.mem.read_map_around_player(radius=map_radius)
-            if tiles:
-                state["map_tiles"] = tiles
-            
-            # 3. Party Pokemon - minimal info only
-            party = self.mem.read_party_pokemon()
-            if party:
-                state["party"] = [
-                    {
-                        "species_name": pokemon.species_name,
-                        "level": pokemon.level,
-                        "current_hp": pokemon.current_hp,
-                        "max_hp": pokemon.max_hp,
-                        "status": pokemon.status.get_status_name() if pokemon.status else "OK"
-                    }
-                    for pokemon in party[:3]  # Only first 3 Pokemon for speed
-                ]
-            
-            # 4. Badges - just count
-            badges = self.mem.read_badges()
-            if badges:
-                state["badges"] = len(badges)
-            
-            # 5. Battle flag - quick check
-            state["in_battle"] = self.mem.is_in_battle()
-            
-        except Exception as e:
-            # Fail silently, return partial state
-            pass
+        Args:
+            out: Optional (3, map_size, map_size) uint8 array to write into
+        
+        Returns:
+            uint8 ndarray of shape (3, map_size, map_size), see fill_map_channels
+        """
+        map_size = 2 * map_radius + 1
+        if out is None:
+            map_array = np.zeros((3, map_size, map_size), dtype=np.uint8)
+        else:
+            map_array = out
+            map_array.fill(0)
+        if self._tile_buf.size:
+            # read_map_around_player already clamps the window to the map,
+            # so the grid is top-left aligned (not always player-centred)
+            fill_map_channels(map_array, self._tile_buf[:map_size, :map_size])
+        return map_array
+    
+    def get_obs_and_state(self, map_radius: int = 3) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """
+        Read the game state once and derive both the DRL observation and the
+        state dict from it (step() needs both every step).
+        
+        The observation arrays are preallocated and reused: they are
+        overwritten by the next call, so copy them if they must outlive it
+        (SB3's VecEnvs copy observations into their own buffers).
+        
+        Returns:
+            (observation, state) as returned by get_observation_for_drl() and
+            get_drl_state()
+        """
+        state = self.get_drl_state(map_radius=map_radius)
+        observation = self._get_obs_buffers(map_radius)
+        self.get_map_window(map_radius, out=observation["map"])
+        self._fill_vector(state, observation["vector"])
+        return observation, state
+    
+    def get_obs_and_record(self, map_radius: int = 3) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Same reads as get_obs_and_state(), but returns a DRL_STATE_DTYPE
+        record instead of the state dict. The observation and record are
+        filled straight from the raw reads, so none of the per-step state
+        dicts are built (this is what step() uses).
+        
+        The observation arrays are reused as in get_obs_and_state(); the
+        record is new on every call.
         
-        return state
+        Returns:
+            (observation, record)
+        """
+        coords, _, party, badges, in_battle = self._read(map_radius)
+        observation = self._get_obs_buffers(map_radius)
+        self.get_map_window(map_radius, out=observation["map"])
+        self._fill_vector_from_reads(coords, party, badges, in_battle, observation["vector"])
+        
+        # Pad the party columns to PARTY_SLOTS and build the record in one go
+        padding = [_EMPTY_SLOT] * (PARTY_SLOTS - len(party))
+        _, levels, hps, max_hps, _ = zip(*(party + padding))
+        x, y = coords if coords is not None else (0, 0)
+        record = np.array(
+            (x, y, badges, in_battle, len(party), hps, max_hps, levels),
+            dtype=DRL_STATE_DTYPE,
+        )
+        return observation, record
+    
+    def _get_obs_buffers(self, map_radius: int) -> Dict[str, np.ndarray]:
+        """The reused observation arrays for map_radius (created on first use)."""
+        observation = self._obs_buffers.get(map_radius)
+        if observation is None:
+            map_size = 2 * map_radius + 1
+            observation = self._obs_buffers[map_radius] = {
+                "map": np.zeros((3, map_size, map_size), dtype=np.uint8),
+                "vector": np.zeros(18, dtype=np.float32),
+            }
+        return observation
     
     def get_observation_for_drl(self, map_radius: int = 3) -> Dict[str, np.ndarray]:
         """
         Get observation in the exact format needed by DRL environment.
+        The returned arrays are reused by the next call (see get_obs_and_state).
         
         Returns:
             Dict with:
-                - 'map': ndarray of shape (map_size, map_size, 3) - normalized [0, 1]
+                - 'map': uint8 ndarray of shape (3, map_size, map_size) - channels-first, see fill_map_channels
                 - 'vector': ndarray of shape (18,) - normalized features
         """
-        state = self.get_drl_state(map_radius=map_radius)
-        
+        return self.get_obs_and_state(map_radius=map_radius)[0]
+    
+    def build_observation(self, state: Dict[str, Any], map_radius: int = 3) -> Dict[str, np.ndarray]:
+        """
+        Build a new DRL observation from an already-read get_drl_state() dict.
+        """
         # Map size (e.g., 7x7 for radius=3)
         map_size = 2 * map_radius + 1
         
-        # Initialize map array (metatile_id, behavior, collision)
-        map_array = np.zeros((map_size, map_size, 3), dtype=np.float32)
-        
-        # Fill map array from tiles
-        if state["map_tiles"]:
-            tiles = state["map_tiles"]
-            for i, row in enumerate(tiles):
-                for j, tile_data in enumerate(row):
-                    if i < map_size and j < map_size:
-                        if len(tile_data) >= 3:
-                            tile_id, behavior, collision = tile_data[:3]
-                            # Normalize to [0, 1]
-                            map_array[i, j, 0] = min(tile_id / 1024.0, 1.0)  # Metatile ID
-                            map_array[i, j, 1] = min(behavior / 255.0, 1.0)  # Behavior
-                            map_array[i, j, 2] = 1.0 if collision else 0.0    # Collision
-        
-        # Initialize vector features (18 elements)
+        # Channels-first (metatile_id, behavior, collision) so the CNN can
+        # consume it without a transpose; uint8 keeps rollout buffers and
+        # SubprocVecEnv pipes 4x smaller than float32
+        map_array = np.zeros((3, map_size, map_size), dtype=np.uint8)
+        if state["map_tiles"] is not None and len(state["map_tiles"]):
+            fill_map_channels(map_array, tiles_to_array(state["map_tiles"])[:map_size, :map_size])
+        
         vector = np.zeros(18, dtype=np.float32)
+        self._fill_vector(state, vector)
+        
+        return {
+            "map": map_array,
+            "vector": vector
+        }
+    
+    @classmethod
+    def _fill_vector(cls, state: Dict[str, Any], vector: np.ndarray) -> None:
+        """Write the 18 normalized vector features for a state dict into vector."""
+        position = state["position"]
+        party = []
+        for pokemon in state["party"][:3]:
+            get = pokemon.get
+            party.append((get("species_id", 0), get("level", 0), get("current_hp", 0), get("max_hp", 1),
+                          0 if get("status") == "OK" else _NOT_OK_STATUS))
+        cls._fill_vector_from_reads(
+            (position["x"], position["y"]) if position else None,
+            party, state["badges"], state["in_battle"], vector,
+        )
+    
+    @staticmethod
+    def _fill_vector_from_reads(coords: Optional[Tuple[int, int]], party: List[Tuple],
+                                badges: int, in_battle: bool, vector: np.ndarray) -> None:
+        """
+        Write the 18 normalized vector features into vector, from the values
+        returned by _read() (party as read_party_basics() tuples).
+        """
+        # Built as a Python list and stored with one slice assignment;
+        # per-element ndarray stores cost more than the math itself
+        features = [0.0] * 18
         
         # Position (2 features)
-        if state["position"]:
-            vector[0] = state["position"]["x"] / 1024.0  # Normalize to ~[0, 1]
-            vector[1] = state["position"]["y"] / 1024.0
+        if coords is not None:
+            features[0] = coords[0] / 1024.0  # Normalize to ~[0, 1]
+            features[1] = coords[1] / 1024.0
         
         # Party Pokemon (12 features = 4 per Pokemon × 3 Pokemon)
-        for i, pokemon in enumerate(state["party"][:3]):
-            idx = 2 + i * 4
-            # Species ID (approximate from name hash - simple encoding)
-            vector[idx] = hash(pokemon.get("species_name", "")) % 256 / 255.0
+        idx = 2
+        for species_id, level, current_hp, max_hp, status in party[:3]:
+            # Species ID (low byte; a hash() of the name would change with
+            # PYTHONHASHSEED between processes)
+            features[idx] = (species_id & 0xFF) / 255.0
             # Level
-            vector[idx + 1] = pokemon.get("level", 0) / 100.0
+            features[idx + 1] = level / 100.0
             # HP ratio
-            current_hp = pokemon.get("current_hp", 0)
-            max_hp = pokemon.get("max_hp", 1)
-            vector[idx + 2] = current_hp / max(max_hp, 1)
+            features[idx + 2] = current_hp / max(max_hp, 1)
             # Status (0 = OK, 1 = not OK)
-            vector[idx + 3] = 0.0 if pokemon.get("status") == "OK" else 1.0
+            features[idx + 3] = 1.0 if status & _NOT_OK_STATUS else 0.0
+            idx += 4
         
         # Game state features (4 features)
-        vector[14] = state["badges"] / 8.0  # Badges count (0-8)
-        vector[15] = 1.0 if state["in_battle"] else 0.0
-        vector[16] = 0.0  # Reserved
-        vector[17] = 0.0  # Reserved
+        features[14] = badges / 8.0  # Badges count (0-8)
+        features[15] = 1.0 if in_battle else 0.0
+        # features[16:18] reserved (0)
         
-        return {
-            "map": map_array,
-            "vector": vector
-        }
+        vector[:] = features
@@ -0,0 +1,78 @@
+"""
+Numeric core of the lightweight DRL reward (see
+PokemonEmeraldEnv._calculate_reward_from_lightweight).
+
+Compiled with numba when it is installed; otherwise the same code runs as
+plain Python, which is still cheaper than NumPy ops on 3-element arrays.
+"""
+import logging
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logging.debug("numba not available - reward core runs uncompiled")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Penalty for standing still, indexed by the (saturating) stationary step
+# count: -0.05 per step, capped at 20 steps
+STATIONARY_STEPS_CAP = 20
+STATIONARY_PENALTY = tuple(-0.05 * i for i in range(STATIONARY_STEPS_CAP + 1))
+
+
+@njit(cache=True)
+def lightweight_reward(prev_badges, prev_level_sum, prev_x, prev_y,
+                       curr_badges, curr_level_sum, curr_x, curr_y,
+                       in_battle, hp, max_hp, party_count, stationary_steps):
+    """
+    Reward for one step from the scalar fields of two DRL_STATE_DTYPE
+    records plus the current party hp / max_hp arrays.
+
+    Returns:
+        (reward, stationary_steps) - the updated stationary step counter,
+        saturating at STATIONARY_STEPS_CAP
+    """
+    reward = 0.0
+
+    # Badge rewards (primary objective)
+    if curr_badges > prev_badges:
+        reward += 1000.0
+
+    # Level up rewards (empty slots hold level 0)
+    if curr_level_sum > prev_level_sum:
+        reward += 50.0
+
+    # Movement rewards (movement doesn't matter in battle)
+    if not in_battle:
+        if curr_x != prev_x or curr_y != prev_y:
+            reward += 0.5
+            stationary_steps = 0
+        else:
+            if stationary_steps < STATIONARY_STEPS_CAP:
+                stationary_steps += 1
+            # Penalize being stuck
+            reward += STATIONARY_PENALTY[stationary_steps]
+    else:
+        stationary_steps = 0
+
+    # HP penalties (only if not in battle)
+    if not in_battle:
+        low = 0
+        hurt = 0
+        for i in range(party_count):
+            hp_ratio = hp[i] / max(max_hp[i], 1)
+            if hp_ratio < 0.2:
+                low += 1
+            elif hp_ratio < 0.5:
+                hurt += 1
+        reward -= 5.0 * low
+        reward -= 1.0 * hurt
+
+    return reward, stationary_steps
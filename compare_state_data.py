@@ -168,9 +168,10 @@ def compare_states():
     print(f"  • Type: Dict with 2 keys: 'map' and 'vector'")
     print()
     print(f"  • map: shape={observation['map'].shape} dtype={observation['map'].dtype}")
-    print(f"    - Channel 0: Metatile ID (normalized 0-1)")
-    print(f"    - Channel 1: Behavior (normalized 0-1)")
-    print(f"    - Channel 2: Collision (0 or 1)")
+    print(f"    - Channel 0: Metatile ID >> 2 (raw uint8, 0-255)")
+    print(f"    - Channel 1: Behavior byte (raw uint8, 0-255)")
+    print(f"    - Channel 2: Collision (0 or 255)")
+    print(f"    - SB3 divides the map by 255 before the CNN")
     print()
     print(f"  • vector: shape={observation['vector'].shape} dtype={observation['vector'].dtype}")
     print(f"    - Elements 0-1: Position (x, y) normalized")
@@ -193,8 +194,8 @@ def compare_states():
     map_arr = observation['map']
     for i in range(3, 4):  # Just show center row
         for j in range(2, 5):  # Center 3 tiles
-            tile = map_arr[i, j]
-            print(f"  Tile[{i},{j}]: id={tile[0]:.3f}, behavior={tile[1]:.3f}, collision={tile[2]:.0f}")
+            tile = map_arr[:, i, j]
+            print(f"  Tile[{i},{j}]: id>>2={tile[0]}, behavior={tile[1]}, collision={tile[2]}")
     print()
     
     # === COMPARISON SUMMARY ===
@@ -211,7 +212,8 @@ def compare_states():
     
     print("📦 DATA SIZE:")
     comp_tiles = len(comprehensive.get('map', {}).get('tiles', [])) ** 2
-    light_tiles = len(lightweight.get('map_tiles', [])) ** 2 if lightweight.get('map_tiles') else 0
+    light_map = lightweight.get('map_tiles')  # ndarray, or None if the read failed
+    light_tiles = len(light_map) ** 2 if light_map is not None else 0
     print(f"  • Comprehensive map: {comp_tiles} tiles")
     print(f"  • Lightweight map: {light_tiles} tiles ({100*light_tiles/comp_tiles:.0f}% of comprehensive)")
     print()
@@ -397,6 +397,17 @@ PokemonStorage = namedtuple("PokemonStorage", [x[0] for x in PokemonStorage_spec
 PokemonStorage_format = "".join([x[1] for x in PokemonStorage_spec])
 
 
+# Position of each of the 4 encrypted substructs, indexed by personality % 24
+SUBSTRUCT_SELECTOR = (
+    (0, 1, 2, 3), (0, 1, 3, 2), (0, 2, 1, 3), (0, 3, 1, 2),
+    (0, 2, 3, 1), (0, 3, 2, 1), (1, 0, 2, 3), (1, 0, 3, 2),
+    (2, 0, 1, 3), (3, 0, 1, 2), (2, 0, 3, 1), (3, 0, 2, 1),
+    (1, 2, 0, 3), (1, 3, 0, 2), (2, 1, 0, 3), (3, 1, 0, 2),
+    (2, 3, 0, 1), (3, 2, 0, 1), (1, 2, 3, 0), (1, 3, 2, 0),
+    (2, 1, 3, 0), (3, 1, 2, 0), (2, 3, 1, 0), (3, 2, 1, 0),
+)
+
+
 def parse_box_pokemon(data):
     if int.from_bytes(data[:4], "little") == 0:
         return None
@@ -407,16 +418,8 @@ def parse_box_pokemon(data):
     substructs_raw = struct.unpack("<" + "I" * 12, box.substructs)
     substructs = [x ^ key for x in substructs_raw]
 
-    substructSelector = [
-		[0, 1, 2, 3], [0, 1, 3, 2], [0, 2, 1, 3], [0, 3, 1, 2],
-		[0, 2, 3, 1], [0, 3, 2, 1], [1, 0, 2, 3], [1, 0, 3, 2],
-		[2, 0, 1, 3], [3, 0, 1, 2], [2, 0, 3, 1], [3, 0, 2, 1],
-		[1, 2, 0, 3], [1, 3, 0, 2], [2, 1, 0, 3], [3, 1, 0, 2],
-		[2, 3, 0, 1], [3, 2, 0, 1], [1, 2, 3, 0], [1, 3, 2, 0],
-		[2, 1, 3, 0], [3, 1, 2, 0], [2, 3, 1, 0], [3, 2, 1, 0],
-    ]
     # get substruct permutation by personality mod 24
-    perm = substructSelector[box.personality % 24]
+    perm = SUBSTRUCT_SELECTOR[box.personality % 24]
     substruct0 = substructs[3 * perm[0] : 3 * (perm[0] + 1)]
     substruct1 = substructs[3 * perm[1] : 3 * (perm[1] + 1)]
     substruct2 = substructs[3 * perm[2] : 3 * (perm[2] + 1)]
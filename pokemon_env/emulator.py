@@ -7,6 +7,7 @@ import json
 import os
 import shutil
 import hashlib
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import numpy as np
@@ -341,6 +342,14 @@ class EmeraldEmulator:
         
         # Memory reader for accessing game state
         self.memory_reader = None
+        
+        # RGB view of the mGBA video buffer (see get_framebuffer_array)
+        self._framebuffer_view = None
+        
+        # Frame stepping used by run_frames_with_button (see _bind_frame_stepping)
+        self._run_frame = None
+        self._add_keys = None
+        self._clear_keys = None
 
         # Memory cache for efficient reading
         self._mem_cache = {}
@@ -352,6 +361,10 @@ class EmeraldEmulator:
         # Milestone tracker for progress tracking (using cache file)
         self.milestone_tracker = MilestoneTracker(os.path.join(self.cache_dir, "milestones_progress.json"))
 
+        # get_current_state() result cache (see _invalidate_state_cache)
+        self._cached_state = None
+        self._cached_state_time = 0.0
+
         # Dialog state tracking for FPS adjustment
         self._cached_dialog_state = False
         self._last_dialog_check_time = 0
@@ -373,6 +386,9 @@ class EmeraldEmulator:
             "l": lib.GBA_KEY_L,
             "r": lib.GBA_KEY_R
         }
+        # Key bitmasks as taken by the native addKeys/clearKeys (the same
+        # value mgba's add_keys() builds from a key index on every call)
+        self.KEY_MASKS = {name: 1 << key for name, key in self.KEY_MAP.items()}
 
     def initialize(self):
         """Load ROM and set up emulator"""
@@ -402,19 +418,15 @@ class EmeraldEmulator:
             # Set up video buffer for frame capture using mgba.image.Image
             self.video_buffer = mgba.image.Image(self.width, self.height)
             self.core.set_video_buffer(self.video_buffer)
+            self._framebuffer_view = None
             self.core.reset()  # Reset after setting video buffer
+            self._bind_frame_stepping()
             
             # Initialize memory reader
             self.memory_reader = PokemonEmeraldReader(self.core)
             
             # Set up callback for memory reader to invalidate emulator cache on area transitions
-            def invalidate_emulator_cache():
-                if hasattr(self, '_cached_state'):
-                    delattr(self, '_cached_state')
-                if hasattr(self, '_cached_state_time'):
-                    delattr(self, '_cached_state_time')
-                    
-            self.memory_reader._emulator_cache_invalidator = invalidate_emulator_cache
+            self.memory_reader._emulator_cache_invalidator = self._invalidate_state_cache
             
             # Set up frame callback to invalidate memory cache
             self.core.add_frame_callback(self._invalidate_mem_cache)
@@ -423,6 +435,39 @@ class EmeraldEmulator:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize mgba: {e}")
 
+    def _bind_frame_stepping(self):
+        """
+        Resolve the calls run_frames_with_button() makes per frame, once.
+        
+        Core.run_frame() re-checks the needs_reset/protected flags through
+        two Python decorator wrappers on every frame. Once the core has been
+        reset (initialize() does) and while it isn't protected (only mGBA's
+        thread attachment sets that, which this class doesn't use), that
+        check always passes, so call the native runFrame/addKeys/clearKeys
+        through Core._core directly. _core, _was_reset and _protected are
+        private to mGBA's Python bindings: if they are missing, fall back to
+        the public run_frame()/add_keys()/clear_keys().
+        """
+        core = self.core
+        try:
+            native = core._core
+            use_native = core._was_reset and not core._protected
+            run_frame, add_keys, clear_keys = native.runFrame, native.addKeys, native.clearKeys
+        except AttributeError:
+            use_native = False
+        
+        if use_native:
+            # The native calls take the core and a key bitmask (KEY_MASKS)
+            self._run_frame = functools.partial(run_frame, native)
+            self._add_keys = functools.partial(add_keys, native)
+            self._clear_keys = functools.partial(clear_keys, native)
+        else:
+            logger.debug("mGBA native core handle unavailable, stepping through Core.run_frame()")
+            # The public key calls take a key index, not a bitmask
+            self._run_frame = core.run_frame
+            self._add_keys = lambda mask: core.add_keys(mask.bit_length() - 1)
+            self._clear_keys = lambda mask: core.clear_keys(mask.bit_length() - 1)
+
     def _invalidate_mem_cache(self):
         """Invalidate memory cache when frame changes"""
         self._mem_cache = {}
@@ -467,9 +512,12 @@ class EmeraldEmulator:
         # Use cached dialog state for performance
         return base_fps * 4 if self._cached_dialog_state else base_fps
 
+    def _invalidate_state_cache(self):
+        """Drop the cached get_current_state() result"""
+        self._cached_state = None
+
     def _update_dialog_state_cache(self):
         """Update cached dialog state (called periodically for performance)"""
-        import time
         current_time = time.time()
         
         # Only check dialog state periodically to avoid performance issues
@@ -540,10 +588,61 @@ class EmeraldEmulator:
                 self.memory_reader.clear_dialogue_cache_on_button_press()
         
         # Clear state cache after action to ensure fresh data
-        if hasattr(self, '_cached_state'):
-            delattr(self, '_cached_state')
-        if hasattr(self, '_cached_state_time'):
-            delattr(self, '_cached_state_time')
+        self._invalidate_state_cache()
+
+    def run_frames_with_button(self, button: str, n: int):
+        """
+        Hold a single button and advance n frames.
+        
+        Same effect as n calls to run_frame_with_buttons([button]), but the
+        key is looked up once and pressed/released with its precomputed
+        bitmask (see KEY_MASKS), frames are stepped with the calls resolved
+        in _bind_frame_stepping(), and the per-action bookkeeping
+        (dialog state, dialogue/state caches) runs once after the last frame.
+        """
+        if not self.core or n <= 0:
+            return
+        
+        button = button.lower()
+        key_mask = self.KEY_MASKS.get(button, 0)
+        
+        if key_mask:
+            self._add_keys(key_mask)
+        run_frame = self._run_frame
+        for _ in range(n):
+            run_frame()
+        if key_mask:
+            self._clear_keys(key_mask)
+        
+        # Update dialog state cache for FPS adjustment
+        self._update_dialog_state_cache()
+        
+        # Clear dialogue cache if A button was pressed (dismisses dialogue)
+        if button == 'a' and self.memory_reader:
+            self.memory_reader.clear_dialogue_cache_on_button_press()
+        
+        # Clear state cache after action to ensure fresh data
+        self._invalidate_state_cache()
+
+    def get_framebuffer_array(self) -> Optional[np.ndarray]:
+        """
+        Return the current frame as an (height, width, 3) uint8 RGB array that
+        views mGBA's video buffer directly (no PIL image, no copy).
+        
+        The same array is returned every time and is overwritten in place by
+        each emulated frame, so copy it to keep a frame.
+        """
+        if not self.core or not self.video_buffer:
+            return None
+        
+        if self._framebuffer_view is None:
+            video_buffer = self.video_buffer
+            # 32-bit color_t is RGBX in memory, the layout to_pil() decodes
+            raw = np.frombuffer(ffi.buffer(video_buffer.buffer), dtype=np.uint8)
+            view = raw.reshape(video_buffer.height, video_buffer.stride, 4)[:, :video_buffer.width, :3]
+            view.setflags(write=False)  # the emulator owns this memory
+            self._framebuffer_view = view
+        return self._framebuffer_view
 
     def get_screenshot(self) -> Optional[Image.Image]:
         """Return the current frame as a PIL image"""
@@ -615,7 +714,12 @@ class EmeraldEmulator:
                 if not isinstance(state_bytes, bytes):
                     state_bytes = bytes(state_bytes)
                 self.core.load_raw_state(state_bytes)
-                logger.info("State loaded.")
+                # In-memory loads are the DRL env's per-episode hard reset,
+                # so only file loads are worth an INFO line
+                if path:
+                    logger.info("State loaded from %s", path)
+                else:
+                    logger.debug("State loaded from memory (%d bytes)", len(state_bytes))
                 
                 # Reset dialog tracking and invalidate map cache when loading new state
                 if self.memory_reader:
@@ -862,7 +966,7 @@ class EmeraldEmulator:
         current_time = time.time()
         
         # Cache state for 100ms to avoid excessive memory reads
-        if hasattr(self, '_cached_state') and hasattr(self, '_cached_state_time'):
+        if self._cached_state is not None:
             if current_time - self._cached_state_time < 0.1:  # 100ms cache
                 return self._cached_state
         
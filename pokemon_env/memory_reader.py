@@ -2,11 +2,13 @@ from dataclasses import dataclass
 import struct
 from typing import Optional, Dict, Any, List, Tuple
 import logging
+import re
 import time
 
+import numpy as np
 from mgba._pylib import ffi, lib
 
-from pokemon_env.emerald_utils import ADDRESSES, Pokemon_format, parse_pokemon, EmeraldCharmap
+from pokemon_env.emerald_utils import ADDRESSES, Pokemon_format, SUBSTRUCT_SELECTOR, parse_pokemon, EmeraldCharmap
 from .enums import MetatileBehavior, StatusCondition, Tileset, PokemonType, PokemonSpecies, Move, Badge, MapLocation
 from .types import PokemonData
 from utils.ocr_dialogue import create_ocr_detector
@@ -14,6 +16,33 @@ from utils import state_formatter
 
 logger = logging.getLogger(__name__)
 
+# Leftover battle/escape text that should not count as active dialog.
+# Compiled once into a single alternation so each check is one scan of the
+# text instead of one substring search per phrase.
+_RESIDUAL_BATTLE_TEXT_RE = re.compile("|".join(map(re.escape, [
+    "got away safely", "fled", "escape", "battle", "wild", "trainer",
+    "used", "attack", "defend", "missed", "critical", "super effective",
+    "fainted", "defeated", "victory", "experience points",
+    "gained", "grew to", "learned", "ran away"
+])))
+_RESIDUAL_DIALOG_TEXT_RE = re.compile("|".join(map(re.escape, [
+    "got away safely", "fled from", "escaped", "ran away",
+    "fainted", "defeated", "victory", "experience points",
+    "gained", "grew to", "learned"
+])))
+
+# The fields of one party Pokemon (see Pokemon_spec) that read_party_basics
+# needs: personality, otId, the encrypted substructs, status, level, hp, maxHp
+_PARTY_BASICS = struct.Struct("<II24x48sIBxHH10x")
+assert _PARTY_BASICS.size == struct.calcsize(Pokemon_format)
+# Byte offset of substruct 0 (which starts with the species) within the
+# encrypted block, indexed by personality % 24
+_SPECIES_OFFSET = tuple(12 * perm[0] for perm in SUBSTRUCT_SELECTOR)
+
+# Behavior bytes that map to a MetatileBehavior member; anything else reads
+# as NORMAL (see get_exact_behavior_from_id)
+_VALID_BEHAVIORS = frozenset(int(behavior) for behavior in MetatileBehavior)
+
 @dataclass
 class MemoryAddresses:
     """Centralized memory address definitions for Pokemon Emerald; many unconfirmed"""
@@ -203,6 +232,9 @@ class PokemonEmeraldReader:
         # Cache for tileset behaviors
         self._cached_behaviors = None
         self._cached_behaviors_map_key = None
+        # metatile ID -> behavior array built from _cached_behaviors
+        self._behavior_table = None
+        self._behavior_table_source = None
         
         # Map buffer cache
         self._map_buffer_addr = None
@@ -241,6 +273,11 @@ class PokemonEmeraldReader:
         }
         self._dialogue_cache_timeout = 3.0  # Clear dialogue cache after 3 seconds of inactivity
         
+        # Raw text buffer contents from the last read_dialog() and the text
+        # decoded from them (the decode only depends on the bytes)
+        self._dialog_buffers_key = None
+        self._dialog_buffers_text = ""
+        
         # Warning rate limiter to prevent spam
         self._warning_cache = {}
         self._warning_rate_limit = 10.0  # Only show same warning once per 10 seconds
@@ -415,7 +452,7 @@ class PokemonEmeraldReader:
         try:
             # Read party count directly from the dedicated address
             party_count = int(self._read_u8(self.addresses.PARTY_COUNT))
-            logger.info(f"Read party count: {party_count}")
+            logger.debug("Read party count: %d", party_count)
             return party_count
         except Exception as e:
             logger.warning(f"Failed to read party size: {e}")
@@ -441,13 +478,13 @@ class PokemonEmeraldReader:
         party = []
         try:
             party_size = self.read_party_size()
-            logger.info(f"Reading party with size: {party_size}")
+            logger.debug("Reading party with size: %d", party_size)
 
             # Read the entire party data from memory
             party_data = self.read_memory(ADDRESSES["gPlayerParty"], party_size * struct.calcsize(Pokemon_format))
 
             for i in range(party_size):
-                logger.info(f"Reading Pokemon at slot {i}")
+                logger.debug("Reading Pokemon at slot %d", i)
                 try:
                     # Calculate the offset for each Pokemon
                     offset = i * self.addresses.PARTY_POKEMON_SIZE
@@ -457,7 +494,7 @@ class PokemonEmeraldReader:
                     pokemon = parse_pokemon(pokemon_data)
                     party.append(pokemon)
 
-                    logger.info(f"Slot {i}: Parsed Pokemon = {pokemon}")
+                    logger.debug("Slot %d: Parsed Pokemon = %s", i, pokemon)
                 except Exception as e:
                     logger.warning(f"Failed to read Pokemon at slot {i}: {e}")
         except Exception as e:
@@ -465,6 +502,31 @@ class PokemonEmeraldReader:
 
         return party
 
+    def read_party_basics(self, max_count: int = 6) -> List[Tuple[int, int, int, int, int]]:
+        """
+        Read (species_id, level, current_hp, max_hp, status) for the first
+        max_count party Pokemon.
+
+        Cheaper than read_party_pokemon() for per-step callers: one bulk read,
+        and only the species word of the encrypted block is decrypted, with
+        no names, moves or PokemonData objects built. Empty slots are skipped
+        just like read_party_pokemon() skips them.
+        """
+        party = []
+        try:
+            count = min(self.read_party_size(), max_count)
+            party_data = self.read_memory(ADDRESSES["gPlayerParty"], count * _PARTY_BASICS.size)
+            for personality, ot_id, substructs, status, level, hp, max_hp in _PARTY_BASICS.iter_unpack(party_data):
+                if personality == 0:
+                    continue
+                offset = _SPECIES_OFFSET[personality % 24]
+                species_id = ((substructs[offset] | (substructs[offset + 1] << 8)) ^ personality ^ ot_id) & 0xFFFF
+                party.append((species_id, level, hp, max_hp, status))
+        except Exception as e:
+            self._rate_limited_warning(f"Failed to read party: {e}", "party")
+
+        return party
+
     def _read_pokemon_moves_from_decrypted(self, decrypted_data: bytes) -> Tuple[List[str], List[int]]:
         """Read moves and PP from decrypted Pokemon data"""
         moves = []
@@ -570,15 +632,9 @@ class PokemonEmeraldReader:
             if has_meaningful_text:
                 # Enhanced residual text filtering (expanded from battle text)
                 cleaned_text = dialog_text.strip().lower()
-                residual_indicators = [
-                    "got away safely", "fled", "escape", "battle", "wild", "trainer",
-                    "used", "attack", "defend", "missed", "critical", "super effective",
-                    "fainted", "defeated", "victory", "experience points",
-                    "gained", "grew to", "learned", "ran away"
-                ]
                 
                 # If the text contains residual indicators, it's likely old text
-                if any(indicator in cleaned_text for indicator in residual_indicators):
+                if _RESIDUAL_BATTLE_TEXT_RE.search(cleaned_text):
                     logger.debug(f"Original detection: Ignoring residual text: {dialog_text[:50]}...")
                     return False
                 
@@ -823,12 +879,7 @@ class PokemonEmeraldReader:
             dialog_text = self.read_dialog()
             if dialog_text:
                 cleaned_text = dialog_text.strip().lower()
-                residual_indicators = [
-                    "got away safely", "fled from", "escaped", "ran away",
-                    "fainted", "defeated", "victory", "experience points",
-                    "gained", "grew to", "learned"
-                ]
-                if any(indicator in cleaned_text for indicator in residual_indicators):
+                if _RESIDUAL_DIALOG_TEXT_RE.search(cleaned_text):
                     logger.debug(f"Enhanced detection: Ignoring residual text: '{dialog_text[:30]}...'")
                     return False
             
@@ -1131,6 +1182,14 @@ class PokemonEmeraldReader:
             logger.warning(f"Failed to read badges: {e}")
             return []
 
+    def read_badge_count(self) -> int:
+        """Read the number of obtained badges (popcount of the badge byte)"""
+        try:
+            return self._read_u8(self.addresses.PLAYER_BADGES).bit_count()
+        except Exception as e:
+            logger.warning(f"Failed to read badges: {e}")
+            return 0
+
     def read_game_time(self) -> Tuple[int, int, int]:
         """Read game time"""
         try:
@@ -1190,12 +1249,8 @@ class PokemonEmeraldReader:
             if caught_addr == 0:
                 return 0
             
-            caught_count = 0
-            for i in range(32):
-                flags = self._read_u8(caught_addr + i)
-                caught_count += bin(flags).count('1')
-            
-            return caught_count
+            # 32 flag bytes, one bit per species
+            return int.from_bytes(self.read_memory(caught_addr, 32), byteorder='little').bit_count()
         except Exception as e:
             logger.warning(f"Failed to read Pokedex caught count: {e}")
             return 0
@@ -1207,12 +1262,8 @@ class PokemonEmeraldReader:
             if seen_addr == 0:
                 return 0
             
-            seen_count = 0
-            for i in range(32):
-                flags = self._read_u8(seen_addr + i)
-                seen_count += bin(flags).count('1')
-            
-            return seen_count
+            # 32 flag bytes, one bit per species
+            return int.from_bytes(self.read_memory(seen_addr, 32), byteorder='little').bit_count()
         except Exception as e:
             logger.warning(f"Failed to read Pokedex seen count: {e}")
             return 0
@@ -2045,8 +2096,13 @@ class PokemonEmeraldReader:
             logger.debug(f"Buffer currency validation failed for 0x{buffer_addr:08X}: {e}")
             return False
 
-    def read_map_around_player(self, radius: int = 7) -> List[List[Tuple[int, MetatileBehavior, int, int]]]:
-        """Read map area around player with improved error handling for area transitions"""
+    def read_map_around_player(self, radius: int = 7, as_array: bool = False) -> List[List[Tuple[int, MetatileBehavior, int, int]]]:
+        """
+        Read map area around player with improved error handling for area transitions
+
+        With as_array=True the tiles come back as an int32 ndarray of shape
+        (H, W, 4) instead of rows of tuples (see read_map_metatiles_array).
+        """
         # Check for area transitions (re-enabled with minimal logic)
         location = self.read_location()
         position = self.read_coordinates()
@@ -2065,10 +2121,10 @@ class PokemonEmeraldReader:
                 return []
         
         # Read map data with simple validation and retry
-        map_data = self._read_map_data_internal(radius)
+        map_data = self._read_map_data_internal(radius, as_array)
         
         # Additional corruption detection: check for invalid map buffer data
-        if map_data and self._map_buffer_addr:
+        if len(map_data) and self._map_buffer_addr:
             try:
                 # Verify buffer is still valid by re-reading dimensions
                 current_width = self._read_u32(self._map_buffer_addr - 8)
@@ -2090,7 +2146,7 @@ class PokemonEmeraldReader:
                     # Try to recover by re-finding buffer
                     if self._find_map_buffer_addresses():
                         logger.debug("Recovered from map buffer corruption")
-                        map_data = self._read_map_data_internal(radius)
+                        map_data = self._read_map_data_internal(radius, as_array)
                     else:
                         logger.error("Failed to recover from map buffer corruption")
                         return []
@@ -2099,7 +2155,7 @@ class PokemonEmeraldReader:
                 # Don't fail completely on validation errors
         
         # Quick validation: check for too many unknown tiles (only for outdoor areas)
-        if map_data and len(map_data) > 0:
+        if len(map_data) > 0:
             try:
                 location_name = self.read_location()
             except Exception:
@@ -2109,17 +2165,21 @@ class PokemonEmeraldReader:
             is_outdoor = location_name and any(keyword in location_name.upper() for keyword in ['TOWN', 'ROUTE', 'CITY', 'ROAD', 'PATH']) if location_name else False
             
             if is_outdoor:
-                total_tiles = sum(len(row) for row in map_data)
-                unknown_count = 0
-                
-                for row in map_data:
-                    for tile in row:
-                        if len(tile) >= 2:
-                            behavior = tile[1]
-                            if hasattr(behavior, 'name') and behavior.name == 'UNKNOWN':
-                                unknown_count += 1
-                            elif isinstance(behavior, int) and behavior == 0:  # UNKNOWN = 0
-                                unknown_count += 1
+                if as_array:
+                    total_tiles = map_data.shape[0] * map_data.shape[1]
+                    unknown_count = int(np.count_nonzero(map_data[:, :, 1] == MetatileBehavior.NORMAL))
+                else:
+                    total_tiles = sum(len(row) for row in map_data)
+                    unknown_count = 0
+                    
+                    for row in map_data:
+                        for tile in row:
+                            if len(tile) >= 2:
+                                behavior = tile[1]
+                                if hasattr(behavior, 'name') and behavior.name == 'UNKNOWN':
+                                    unknown_count += 1
+                                elif isinstance(behavior, int) and behavior == 0:  # UNKNOWN = 0
+                                    unknown_count += 1
                 
                 unknown_ratio = unknown_count / total_tiles if total_tiles > 0 else 0
                 
@@ -2128,12 +2188,12 @@ class PokemonEmeraldReader:
                     logger.info(f"Outdoor map has {unknown_ratio:.1%} unknown tiles, retrying with cache invalidation")
                     self.invalidate_map_cache()
                     if self._find_map_buffer_addresses():
-                        map_data = self._read_map_data_internal(radius)
+                        map_data = self._read_map_data_internal(radius, as_array)
             else:
                 logger.debug(f"Skipping validation for indoor area: {location_name}")
                 
         
-        logger.info(f"Map data: {map_data}")
+        logger.debug("Map data: %s", map_data)
         
         return map_data
         
@@ -2183,7 +2243,7 @@ class PokemonEmeraldReader:
         
         return []
     
-    def _read_map_data_internal(self, radius: int = 7) -> List[List[Tuple[int, MetatileBehavior, int, int]]]:
+    def _read_map_data_internal(self, radius: int = 7, as_array: bool = False) -> List[List[Tuple[int, MetatileBehavior, int, int]]]:
         """Internal method to read map data without validation/retry logic"""
         
         try:
@@ -2234,6 +2294,8 @@ class PokemonEmeraldReader:
                 width = min(width, 15)
                 height = min(height, 15)
             
+            if as_array:
+                return self.read_map_metatiles_array(x_start, y_start, width, height)
             return self.read_map_metatiles(x_start, y_start, width, height)
         except Exception as e:
             logger.warning(f"Failed to read map data internally: {e}")
@@ -2301,6 +2363,71 @@ class PokemonEmeraldReader:
             logger.warning(f"Failed to read map metatiles: {e}")
             return []
 
+    def read_map_metatiles_array(self, x_start: int = 0, y_start: int = 0, width: int = None, height: int = None) -> np.ndarray:
+        """
+        Same tiles as read_map_metatiles(), as an int32 array of shape
+        (height, width, 4) holding (metatile_id, behavior, collision, elevation).
+
+        The window is read from the map buffer in one bulk read and decoded
+        with array ops instead of one u16 read and enum lookup per tile.
+        Returns an empty (0, 0, 4) array when the window can't be read.
+        """
+        empty = np.zeros((0, 0, 4), dtype=np.int32)
+        if not self._map_buffer_addr:
+            self._rate_limited_warning("No map buffer address available", "map_buffer")
+            return empty
+        
+        if width is None:
+            width = self._map_width
+        if height is None:
+            height = self._map_height
+        
+        # Validate dimensions
+        if not width or not height:
+            logger.warning(f"Invalid map dimensions: {width}x{height}")
+            return empty
+        
+        width = min(width, self._map_width - x_start)
+        height = min(height, self._map_height - y_start)
+        
+        # Additional validation
+        if width <= 0 or height <= 0:
+            logger.warning(f"Invalid reading area: {width}x{height} at ({x_start}, {y_start})")
+            return empty
+        
+        try:
+            # Whole rows y_start..y_start+height, then crop the columns
+            row_start = self._map_buffer_addr + y_start * self._map_width * 2
+            raw = np.frombuffer(self.read_memory(row_start, height * self._map_width * 2), dtype='<u2')
+            raw = raw.reshape(height, self._map_width)[:, x_start:x_start + width]
+            
+            tiles = np.empty((height, width, 4), dtype=np.int32)
+            metatile_ids = raw & 0x03FF
+            tiles[:, :, 0] = metatile_ids
+            tiles[:, :, 1] = self._get_behavior_table()[metatile_ids]
+            tiles[:, :, 2] = (raw & 0x0C00) >> 10
+            tiles[:, :, 3] = raw >> 12
+            return tiles
+        except Exception as e:
+            logger.warning(f"Failed to read map metatiles: {e}")
+            return empty
+
+    def _get_behavior_table(self) -> np.ndarray:
+        """
+        Lookup table from metatile ID (0..0x3FF) to behavior, with the same
+        NORMAL fallbacks as get_exact_behavior_from_id(). Rebuilt only when
+        get_all_metatile_behaviors() returns a different list.
+        """
+        all_behaviors = self.get_all_metatile_behaviors()
+        if self._behavior_table is None or all_behaviors is not self._behavior_table_source:
+            table = np.zeros(0x400, dtype=np.int32)  # MetatileBehavior.NORMAL
+            for metatile_id, behavior in enumerate(all_behaviors[:0x400]):
+                if behavior in _VALID_BEHAVIORS:
+                    table[metatile_id] = behavior
+            self._behavior_table = table
+            self._behavior_table_source = all_behaviors
+        return self._behavior_table
+
     # Tileset reading methods (keeping existing implementation)
     def get_map_layout_base_address(self) -> int:
         """Get map layout base address"""
@@ -3255,6 +3382,16 @@ class PokemonEmeraldReader:
         
         return diagnostics
 
+    def _read_text_buffer(self, address: int, length: int) -> bytes:
+        """Read a text buffer in one slice, falling back to _read_bytes on a short/failed read"""
+        try:
+            data = self.read_memory(address, length)
+            if len(data) == length:
+                return bytes(data)
+        except Exception:
+            pass
+        return self._read_bytes(address, length)
+
     def read_dialog(self) -> str:
         """Read any dialog text currently on screen by scanning text buffers"""
         try:
@@ -3280,13 +3417,18 @@ class PokemonEmeraldReader:
                 (self.addresses.TEXT_BUFFER_4, 200),
             ]
             
+            # Read every buffer in one slice each; if none of them changed
+            # since the last call the decoded text is the same, so skip the
+            # per-byte decode below (the common "no new dialog" case)
+            raw_buffers = [self._read_text_buffer(addr, size) for addr, size in text_buffers]
+            buffers_key = b"".join(raw_buffers)
+            if buffers_key == self._dialog_buffers_key:
+                return self._dialog_buffers_text
+            
             dialog_text = ""
             
-            for buffer_addr, buffer_size in text_buffers:
+            for (buffer_addr, buffer_size), buffer_bytes in zip(text_buffers, raw_buffers):
                 try:
-                    # Read the specified amount of bytes for this buffer
-                    buffer_bytes = self._read_bytes(buffer_addr, buffer_size)
-                    
                     # Look for text patterns
                     text_lines = []
                     current_line = []
@@ -3349,7 +3491,9 @@ class PokemonEmeraldReader:
                     logger.debug(f"Failed to read from buffer 0x{buffer_addr:08X} (size: {buffer_size}): {e}")
                     continue
             
-            return dialog_text.strip()
+            self._dialog_buffers_key = buffers_key
+            self._dialog_buffers_text = dialog_text.strip()
+            return self._dialog_buffers_text
             
         except Exception as e:
             logger.warning(f"Failed to read dialog: {e}")
@@ -3377,12 +3521,7 @@ class PokemonEmeraldReader:
         memory_text = ""
         if raw_memory_text:
             cleaned_text = raw_memory_text.strip().lower()
-            residual_indicators = [
-                "got away safely", "fled from", "escaped", "ran away",
-                "fainted", "defeated", "victory", "experience points", 
-                "gained", "grew to", "learned"
-            ]
-            if any(indicator in cleaned_text for indicator in residual_indicators):
+            if _RESIDUAL_DIALOG_TEXT_RE.search(cleaned_text):
                 logger.debug(f"OCR fallback: Filtering out residual battle text: '{raw_memory_text[:30]}...'")
                 memory_text = ""  # Treat as no memory text
             else:
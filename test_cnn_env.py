@@ -46,7 +46,7 @@ def test_environment():
     # Display map statistics
     print("\n   📊 Map channels:")
     for i, channel_name in enumerate(['Metatile ID', 'Behavior', 'Collision']):
-        channel = obs['map'][:, :, i]
+        channel = obs['map'][i]
         print(f"      Channel {i} ({channel_name}):")
         print(f"         Range: [{channel.min():.3f}, {channel.max():.3f}]")
         print(f"         Mean: {channel.mean():.3f}")
@@ -107,7 +107,7 @@ def visualize_map_channel(env, channel_idx=2):
     print(f"\n📍 Map Channel {channel_idx} (7x7 grid):")
     print("   " + "-" * 29)
     
-    channel = map_data[:, :, channel_idx]
+    channel = map_data[channel_idx]
     for i in range(7):
         row_str = "   | "
         for j in range(7):
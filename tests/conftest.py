@@ -0,0 +1,133 @@
+"""
+Shared fakes for the DRL fast-path tests (no ROM or running emulator needed)
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pokemon_env.emerald_utils import ADDRESSES
+from pokemon_env.memory_reader import PokemonEmeraldReader
+
+
+START_POSITION = (10, 20)
+MAP_BUFFER_ADDR = 0x02010000
+
+
+class FakeMemoryReader:
+    """The reads LightweightStateReader makes, returning fixed values."""
+
+    def __init__(self, tiles=None, party=(), coords=(17, 42), badges=3, in_battle=False):
+        self.core = SimpleNamespace(frame_counter=0)
+        self.tiles = tiles
+        self.party = list(party)
+        self.coords = coords
+        self.badges = badges
+        self.in_battle = in_battle
+
+    def read_coordinates(self):
+        return self.coords
+
+    def read_map_around_player(self, radius=7, as_array=False):
+        if self.tiles is None:
+            return np.zeros((0, 0, 4), dtype=np.int32)
+        tiles = np.zeros(self.tiles.shape[:2] + (4,), dtype=np.int32)
+        tiles[:, :, :3] = self.tiles
+        return tiles
+
+    def read_party_basics(self, max_count=6):
+        return self.party[:max_count]
+
+    def read_badge_count(self):
+        return self.badges
+
+    def is_in_battle(self):
+        return self.in_battle
+
+
+class FakeEmulator:
+    """EmeraldEmulator stand-in: every action moves the player one tile right."""
+
+    def __init__(self, rom_path=None, headless=True):
+        self.memory_reader = FakeMemoryReader(party=[(277, 5, 20, 20, 0)], badges=0)
+        self._place_player(*START_POSITION)
+
+    def _place_player(self, x, y):
+        # The map depends on the position, so every move changes the observation
+        ids = (x * 4 + np.arange(49).reshape(7, 7)) % 0x400
+        self.memory_reader.tiles = np.stack([ids, np.full_like(ids, x % 256), np.zeros_like(ids)], axis=-1)
+        self.memory_reader.coords = (x, y)
+        self.memory_reader.core.frame_counter += 1
+
+    def initialize(self):
+        pass
+
+    def load_state(self, path=None, state_bytes=None):
+        self._place_player(*START_POSITION)
+
+    def save_state(self, path=None):
+        return b"state"
+
+    def run_frames_with_button(self, button, n):
+        x, y = self.memory_reader.coords
+        self._place_player(x + 1, y)
+
+    def stop(self):
+        pass
+
+
+class BufferReader(PokemonEmeraldReader):
+    """PokemonEmeraldReader over in-memory party / map buffers."""
+
+    def __init__(self, party_data=b"", party_size=0, map_data=b"", map_width=0, map_height=0, behaviors=()):
+        # No emulator core: only the state the bulk-read helpers use
+        self.party_data = party_data
+        self.party_size = party_size
+        self.map_data = map_data
+        self._map_buffer_addr = MAP_BUFFER_ADDR
+        self._map_width = map_width
+        self._map_height = map_height
+        self.behaviors = list(behaviors)
+        self._behavior_table = None
+        self._behavior_table_source = None
+        self.warnings = []
+
+    def read_party_size(self):
+        return self.party_size
+
+    def read_memory(self, address, size=1):
+        if address == ADDRESSES["gPlayerParty"]:
+            return self.party_data[:size]
+        offset = address - MAP_BUFFER_ADDR
+        return self.map_data[offset:offset + size]
+
+    def get_all_metatile_behaviors(self):
+        return self.behaviors
+
+    def _rate_limited_warning(self, message, category="general"):
+        self.warnings.append(message)
+
+
+@pytest.fixture
+def fake_memory_reader():
+    """Factory for FakeMemoryReader."""
+    return FakeMemoryReader
+
+
+@pytest.fixture
+def buffer_reader():
+    """Factory for BufferReader."""
+    return BufferReader
+
+
+@pytest.fixture
+def make_env(monkeypatch):
+    """Factory for PokemonEmeraldEnv running on FakeEmulator."""
+    import agent.drl_env as drl_env
+    monkeypatch.setattr(drl_env, "EmeraldEmulator", FakeEmulator)
+
+    def _make(**kwargs):
+        return drl_env.PokemonEmeraldEnv(rom_path="fake.gba", initial_state_path="fake.state", **kwargs)
+
+    return _make
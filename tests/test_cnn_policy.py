@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Pytest for the BN-folded inference path of the CNN policy"""
+
+import numpy as np
+import pytest
+import torch
+from gymnasium import spaces
+
+from agent.cnn_policy import PokemonCNNExtractor, PokemonCNNPolicy
+
+
+OBSERVATION_SPACE = spaces.Dict({
+    'map': spaces.Box(low=0, high=255, shape=(3, 7, 7), dtype=np.uint8),
+    'vector': spaces.Box(low=-1.0, high=1.0, shape=(18,), dtype=np.float32),
+})
+
+
+def random_obs(batch=8, seed=0):
+    generator = torch.Generator().manual_seed(seed)
+    return {
+        'map': torch.rand(batch, 3, 7, 7, generator=generator),
+        'vector': torch.rand(batch, 18, generator=generator) * 2 - 1,
+    }
+
+
+def warm_up_batch_norm(extractor, steps=5):
+    """Move the BN running stats away from their initial values."""
+    extractor.train()
+    with torch.no_grad():
+        for seed in range(steps):
+            extractor(random_obs(batch=32, seed=100 + seed))
+
+
+def unfused_eval_forward(extractor, obs):
+    """Eval-mode forward through the training modules (BN with running stats)."""
+    with torch.no_grad():
+        map_features = extractor.map_cnn(obs['map'])
+        vector_features = extractor.vector_mlp(obs['vector'])
+        return extractor.fusion(torch.cat([map_features, vector_features], dim=1))
+
+
+@pytest.fixture
+def extractor():
+    torch.manual_seed(0)
+    extractor = PokemonCNNExtractor(OBSERVATION_SPACE)
+    warm_up_batch_norm(extractor)
+    return extractor.eval()
+
+
+def test_fused_forward_matches_training_modules(extractor):
+    obs = random_obs()
+    expected = unfused_eval_forward(extractor, obs)
+    extractor.fuse_for_inference()
+    with torch.no_grad():
+        output = extractor(obs)
+    torch.testing.assert_close(output, expected, atol=1e-5, rtol=1e-5)
+
+
+def test_fused_copies_stay_out_of_state_dict(extractor):
+    keys = set(extractor.state_dict())
+    parameter_count = len(list(extractor.parameters()))
+    extractor.fuse_for_inference()
+    assert set(extractor.state_dict()) == keys
+    assert len(list(extractor.parameters())) == parameter_count
+    assert not any('fused' in key or 'split' in key for key in keys)
+
+
+def make_policy():
+    torch.manual_seed(0)
+    return PokemonCNNPolicy(OBSERVATION_SPACE, spaces.Discrete(8), lr_schedule=lambda _: 3e-4)
+
+
+def policy_features(policy, obs):
+    with torch.no_grad():
+        return policy.features_extractor(obs)
+
+
+def test_set_training_mode_refreshes_fused_copy():
+    policy = make_policy()
+    extractor = policy.features_extractor
+    warm_up_batch_norm(extractor)
+    policy.set_training_mode(False)
+    assert extractor._fused_map_cnn is not None
+    obs = random_obs()
+    torch.testing.assert_close(policy_features(policy, obs), unfused_eval_forward(extractor, obs),
+                               atol=1e-5, rtol=1e-5)
+
+    # Change the weights and BN stats as a training epoch would
+    policy.set_training_mode(True)
+    with torch.no_grad():
+        extractor.map_cnn[0].weight.mul_(1.5)
+        extractor.fusion[0].weight.add_(0.01)
+    warm_up_batch_norm(extractor)
+    policy.set_training_mode(False)
+    torch.testing.assert_close(policy_features(policy, obs), unfused_eval_forward(extractor, obs),
+                               atol=1e-5, rtol=1e-5)
+
+
+def test_save_load_round_trip(tmp_path):
+    policy = make_policy()
+    warm_up_batch_norm(policy.features_extractor)
+    policy.set_training_mode(False)
+    path = tmp_path / "policy.zip"
+    policy.save(str(path))
+
+    loaded = PokemonCNNPolicy.load(str(path))
+    assert set(loaded.state_dict()) == set(policy.state_dict())
+    loaded.set_training_mode(False)
+    obs = random_obs()
+    torch.testing.assert_close(policy_features(loaded, obs), policy_features(policy, obs),
+                               atol=1e-5, rtol=1e-5)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test that PokemonEmeraldEnv observations survive the reader's buffer reuse.
+"""
+
+import numpy as np
+import pytest
+
+
+def snapshot(observation):
+    return {key: value.copy() for key, value in observation.items()}
+
+
+def assert_obs_equal(observation, expected):
+    assert observation.keys() == expected.keys()
+    for key in expected:
+        np.testing.assert_array_equal(observation[key], expected[key])
+
+
+@pytest.mark.parametrize("hard_reset", [False, True])
+def test_terminal_observation_unchanged_after_reset(make_env, hard_reset):
+    """Test that the last step's observation survives reset() and the next step."""
+    env = make_env(max_steps=2, hard_reset=hard_reset)
+    env.reset()
+    env.step(4)
+    terminal_obs, _, _, truncated, _ = env.step(4)
+    assert truncated
+    expected = snapshot(terminal_obs)
+
+    env.reset()
+    assert_obs_equal(terminal_obs, expected)
+    env.step(4)
+    assert_obs_equal(terminal_obs, expected)
+
+
+def test_mid_episode_steps_reuse_reader_arrays(make_env):
+    """Test that only the step ending the episode pays for a copy."""
+    env = make_env(max_steps=3)
+    env.reset()
+    first, *_ = env.step(4)
+    second, *_ = env.step(4)
+    assert first["map"] is second["map"]
+    last, _, _, truncated, _ = env.step(4)
+    assert truncated and last["map"] is not second["map"]
+
+
+def test_hard_reset_observations_are_independent(make_env):
+    """Test that every hard reset returns the same values in its own arrays."""
+    env = make_env(hard_reset=True)
+    first, _ = env.reset()
+    expected = snapshot(first)
+    first["map"][:] = 0
+    first["vector"][:] = 0
+
+    second, _ = env.reset()
+    assert_obs_equal(second, expected)
+    assert not np.shares_memory(first["map"], second["map"])
+
+
+@pytest.mark.parametrize("hard_reset", [False, True])
+def test_vec_env_terminal_observation(make_env, hard_reset):
+    """Test that DummyVecEnv's terminal_observation keeps the last step's values."""
+    from stable_baselines3.common.vec_env import DummyVecEnv
+
+    vec_env = DummyVecEnv([lambda: make_env(max_steps=2, hard_reset=hard_reset)])
+    vec_env.reset()
+    vec_env.step(np.array([4]))
+    _, _, dones, infos = vec_env.step(np.array([4]))
+    assert dones[0]
+
+    terminal_obs = infos[0]["terminal_observation"]
+    expected = snapshot(terminal_obs)
+    vec_env.step(np.array([4]))
+    assert_obs_equal(terminal_obs, expected)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test the LightweightStateReader fast paths against the dict-based path.
+"""
+
+import numpy as np
+import pytest
+
+import agent.lightweight_state_reader as lsr
+from agent.lightweight_state_reader import (
+    LightweightStateReader,
+    drl_state_to_record,
+    fill_map_channels,
+)
+
+
+# (species_id, level, current_hp, max_hp, status) as read_party_basics() returns
+PARTY = [
+    (277, 12, 30, 35, 0),      # OK
+    (280, 9, 5, 28, 0x08),     # poisoned
+    (261, 7, 0, 22, 0),        # fainted
+    (270, 15, 40, 40, 0x03),   # asleep
+    (263, 4, 1, 19, 0x80),     # bad-poison bit alone still reads as OK
+    (286, 30, 80, 90, 0x40),   # paralyzed
+]
+
+
+def reference_map(tiles, map_size):
+    """Encode an (H, W, 3) tile array one tile at a time."""
+    map_array = np.zeros((3, map_size, map_size), dtype=np.uint8)
+    for i in range(min(len(tiles), map_size)):
+        for j in range(min(len(tiles[i]), map_size)):
+            metatile_id, behavior, collision = (int(v) for v in tiles[i][j][:3])
+            map_array[0, i, j] = min(metatile_id >> 2, 255)
+            map_array[1, i, j] = min(behavior, 255)
+            map_array[2, i, j] = 255 if collision else 0
+    return map_array
+
+
+def random_tiles(rng, height, width):
+    tiles = np.empty((height, width, 3), dtype=np.int32)
+    tiles[:, :, 0] = rng.integers(0, 0x400, (height, width))
+    # Behaviors past one byte are clamped to 255
+    tiles[:, :, 1] = rng.integers(0, 300, (height, width))
+    tiles[:, :, 2] = rng.integers(0, 4, (height, width))
+    return tiles
+
+
+@pytest.fixture(params=[
+    "numpy",
+    pytest.param("numba", marks=pytest.mark.skipif(not lsr.NUMBA_AVAILABLE, reason="numba not installed")),
+])
+def map_path(request, monkeypatch):
+    """Run fill_map_channels() through either of its implementations."""
+    if request.param == "numpy":
+        monkeypatch.setattr(lsr, "NUMBA_AVAILABLE", False)
+    return request.param
+
+
+def test_fill_map_channels(map_path):
+    """Test the uint8 map encoding against the per-tile reference."""
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        tiles = random_tiles(rng, 7, 7)
+        map_array = np.zeros((3, 7, 7), dtype=np.uint8)
+        fill_map_channels(map_array, tiles)
+        np.testing.assert_array_equal(map_array, reference_map(tiles, 7))
+
+
+@pytest.mark.parametrize("shape", [(4, 5), (7, 3), (1, 1), (9, 9)])
+def test_map_window_out_of_bounds(map_path, fake_memory_reader, shape):
+    """Test that uncovered window cells are 0 and larger grids are cropped."""
+    tiles = random_tiles(np.random.default_rng(1), *shape)
+    reader = LightweightStateReader(fake_memory_reader(tiles=tiles))
+    reader.get_drl_state(map_radius=3)
+
+    # Stale values in a reused buffer must not survive either
+    out = np.full((3, 7, 7), 99, dtype=np.uint8)
+    window = reader.get_map_window(map_radius=3, out=out)
+    assert window is out
+    np.testing.assert_array_equal(window, reference_map(tiles, 7))
+
+
+@pytest.mark.parametrize("party_size", [0, 1, 3, 6])
+@pytest.mark.parametrize("in_battle", [False, True])
+def test_obs_and_record_match_dict_path(fake_memory_reader, party_size, in_battle):
+    """Test get_obs_and_record() against get_drl_state() + build_observation()."""
+    tiles = random_tiles(np.random.default_rng(party_size), 7, 7)
+    reader = LightweightStateReader(fake_memory_reader(tiles=tiles, party=PARTY[:party_size], in_battle=in_battle))
+
+    state = reader.get_drl_state(map_radius=3)
+    assert len(state["party"]) == min(party_size, lsr.PARTY_SLOTS)
+    expected_obs = reader.build_observation(state, map_radius=3)
+    expected_record = drl_state_to_record(state)
+
+    observation, record = reader.get_obs_and_record(map_radius=3)
+    np.testing.assert_array_equal(observation["map"], expected_obs["map"])
+    np.testing.assert_array_equal(observation["vector"], expected_obs["vector"])
+    assert record.dtype == lsr.DRL_STATE_DTYPE
+    assert record.tobytes() == expected_record.tobytes()
+
+
+def test_obs_and_record_failed_reads(fake_memory_reader):
+    """Test that missing tiles and position give an empty map and a zeroed record."""
+    reader = LightweightStateReader(fake_memory_reader(tiles=None, coords=None, badges=0))
+    observation, record = reader.get_obs_and_record(map_radius=3)
+    assert not observation["map"].any()
+    assert observation["vector"][0] == observation["vector"][1] == 0.0
+    assert record.tobytes() == np.zeros((), dtype=lsr.DRL_STATE_DTYPE).tobytes()
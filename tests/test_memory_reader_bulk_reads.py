@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test the bulk party / map reads against the per-field readers.
+"""
+
+import random
+import struct
+
+import numpy as np
+import pytest
+
+from pokemon_env.emerald_utils import Pokemon, Pokemon_format, parse_box_pokemon
+
+
+PARTY_MON_SIZE = struct.calcsize("<" + Pokemon_format)
+
+
+def random_party(rng, size, empty_slots=()):
+    """Random party structs; empty_slots get personality 0."""
+    blobs = []
+    for slot in range(size):
+        blob = bytearray(rng.getrandbits(8) for _ in range(PARTY_MON_SIZE))
+        if slot in empty_slots:
+            blob[0:4] = bytes(4)
+        blobs.append(bytes(blob))
+    return blobs
+
+
+def reference_party_basics(blobs):
+    """(species_id, level, hp, max_hp, status) via the full decoder."""
+    party = []
+    for blob in blobs:
+        pokemon = Pokemon._make(struct.unpack("<" + Pokemon_format, blob))
+        box = parse_box_pokemon(pokemon.box)
+        if box is None:
+            continue
+        party.append((box["substructs"][0]["species"], pokemon.level, pokemon.hp, pokemon.maxHp, pokemon.status))
+    return party
+
+
+@pytest.mark.parametrize("size", [0, 1, 3, 6])
+def test_party_basics_match_decoder(buffer_reader, size):
+    """Test read_party_basics() against parse_box_pokemon()."""
+    rng = random.Random(size)
+    for _ in range(50):
+        blobs = random_party(rng, size)
+        reader = buffer_reader(party_data=b"".join(blobs), party_size=size)
+        assert reader.read_party_basics(6) == reference_party_basics(blobs)
+        assert reader.read_party_basics(3) == reference_party_basics(blobs[:3])
+        assert not reader.warnings
+
+
+def test_party_basics_skip_empty_slots(buffer_reader):
+    """Test that slots with personality 0 are skipped."""
+    blobs = random_party(random.Random(7), 6, empty_slots=(1, 4))
+    party = buffer_reader(party_data=b"".join(blobs), party_size=6).read_party_basics(6)
+    assert len(party) == 4
+    assert party == reference_party_basics(blobs)
+
+
+def make_map(buffer_reader, rng, width, height, behavior_count):
+    map_data = bytes(rng.getrandbits(8) for _ in range(width * height * 2))
+    # Includes values that aren't MetatileBehavior members (read as NORMAL)
+    behaviors = [rng.randint(0, 255) for _ in range(behavior_count)]
+    return buffer_reader(map_data=map_data, map_width=width, map_height=height, behaviors=behaviors)
+
+
+def assert_same_tiles(reader, *window):
+    tiles = reader.read_map_metatiles(*window)
+    array = reader.read_map_metatiles_array(*window)
+    assert array.dtype == np.int32
+    if not tiles:
+        assert array.shape == (0, 0, 4)
+        return
+    expected = np.array([[[int(v) for v in tile] for tile in row] for row in tiles], dtype=np.int32)
+    np.testing.assert_array_equal(array, expected)
+
+
+@pytest.mark.parametrize("behavior_count", [0, 300, 0x400])
+def test_map_metatiles_array_matches_tiles(buffer_reader, behavior_count):
+    """Test read_map_metatiles_array() against read_map_metatiles()."""
+    rng = random.Random(behavior_count)
+    for _ in range(50):
+        width, height = rng.randint(1, 40), rng.randint(1, 40)
+        reader = make_map(buffer_reader, rng, width, height, behavior_count)
+        x, y = rng.randrange(width), rng.randrange(height)
+        assert_same_tiles(reader, x, y, rng.randint(1, 15), rng.randint(1, 15))
+
+
+@pytest.mark.parametrize("window", [
+    (10, 6, 15, 15),   # runs past the right and bottom edges: clipped
+    (0, 0, 64, 64),    # larger than the whole map
+    (12, 0, 3, 3),     # starts past the right edge: nothing to read
+    (0, 8, 3, 3),      # starts past the bottom edge: nothing to read
+])
+def test_map_metatiles_array_out_of_bounds(buffer_reader, window):
+    """Test windows that run off the map."""
+    reader = make_map(buffer_reader, random.Random(3), 12, 8, 0x400)
+    assert_same_tiles(reader, *window)
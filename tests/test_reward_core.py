@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test the lightweight_reward kernel against the original dict-based reward.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from agent.lightweight_state_reader import drl_state_to_record
+from agent.reward_core import (
+    NUMBA_AVAILABLE,
+    STATIONARY_STEPS_CAP,
+    lightweight_reward,
+)
+
+
+# Plain Python version of the kernel (the kernel itself when numba is missing)
+PY_REWARD = getattr(lightweight_reward, "py_func", lightweight_reward)
+
+KERNELS = [
+    pytest.param(PY_REWARD, id="python"),
+    pytest.param(
+        lightweight_reward,
+        id="numba",
+        marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed"),
+    ),
+]
+
+
+def reference_reward(prev_state, current_state, stationary_steps):
+    """The original dict-based reward (PokemonEmeraldEnv before the kernel)."""
+    reward = 0.0
+
+    prev_badges = prev_state.get('badges', 0) if prev_state else 0
+    curr_badges = current_state.get('badges', 0)
+    if curr_badges > prev_badges:
+        reward += 1000.0
+
+    prev_party = prev_state.get('party', []) if prev_state else []
+    curr_party = current_state.get('party', [])
+    prev_levels = sum(p.get('level', 0) for p in prev_party)
+    curr_levels = sum(p.get('level', 0) for p in curr_party)
+    if curr_levels > prev_levels:
+        reward += 50.0
+
+    prev_pos = prev_state.get('position', {}) if prev_state else {}
+    curr_pos = current_state.get('position', {})
+    prev_coords = (prev_pos.get('x', 0), prev_pos.get('y', 0))
+    curr_coords = (curr_pos.get('x', 0), curr_pos.get('y', 0))
+
+    in_battle = current_state.get('in_battle', False)
+
+    if not in_battle:
+        if curr_coords != prev_coords:
+            reward += 0.5
+            stationary_steps = 0
+        else:
+            stationary_steps += 1
+            reward -= 0.05 * min(stationary_steps, 20)
+    else:
+        stationary_steps = 0
+
+    if not in_battle:
+        for pokemon in curr_party:
+            current_hp = pokemon.get('current_hp', 0)
+            max_hp = pokemon.get('max_hp', 1)
+            hp_ratio = current_hp / max(max_hp, 1)
+            if hp_ratio < 0.2:
+                reward -= 5.0
+            elif hp_ratio < 0.5:
+                reward -= 1.0
+
+    return reward, stationary_steps
+
+
+def kernel_reward(kernel, prev_state, current_state, stationary_steps):
+    """Call the kernel the way PokemonEmeraldEnv does, from two state dicts."""
+    prev, curr = drl_state_to_record(prev_state), drl_state_to_record(current_state)
+    reward, stationary_steps = kernel(
+        int(prev['badges']), int(prev['level'].sum()),
+        int(prev['x']), int(prev['y']),
+        int(curr['badges']), int(curr['level'].sum()),
+        int(curr['x']), int(curr['y']),
+        bool(curr['in_battle']),
+        curr['hp'], curr['max_hp'],
+        int(curr['party_count']),
+        stationary_steps,
+    )
+    return float(reward), int(stationary_steps)
+
+
+def random_state(rng):
+    return {
+        "position": {"x": rng.randint(0, 3), "y": rng.randint(0, 3)},
+        "badges": rng.randint(0, 8),
+        "in_battle": rng.random() < 0.3,
+        "party": [
+            {
+                "level": rng.randint(1, 100),
+                "current_hp": rng.randint(0, 50),
+                "max_hp": rng.choice([0, 50, 100]),
+            }
+            for _ in range(rng.randint(0, 3))
+        ],
+    }
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_matches_dict_reward(kernel):
+    """Test random state pairs against reference_reward()."""
+    rng = random.Random(0)
+    for _ in range(2000):
+        prev_state, current_state = random_state(rng), random_state(rng)
+        steps = rng.randint(0, STATIONARY_STEPS_CAP)
+        expected, expected_steps = reference_reward(prev_state, current_state, steps)
+        reward, new_steps = kernel_reward(kernel, prev_state, current_state, steps)
+        assert reward == pytest.approx(expected)
+        # The original counter kept growing past the penalty cap
+        assert new_steps == min(expected_steps, STATIONARY_STEPS_CAP)
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_stationary_penalty_is_capped(kernel):
+    """Test that standing still costs 0.05 per step, capped at 20 steps."""
+    state = {"position": {"x": 5, "y": 5}, "badges": 0, "in_battle": False, "party": []}
+    ref_steps = steps = 0
+    for step in range(1, 3 * STATIONARY_STEPS_CAP):
+        expected, ref_steps = reference_reward(state, state, ref_steps)
+        reward, steps = kernel_reward(kernel, state, state, steps)
+        assert reward == pytest.approx(expected)
+        assert reward == pytest.approx(-0.05 * min(step, STATIONARY_STEPS_CAP))
+        assert steps == min(step, STATIONARY_STEPS_CAP)
+
+    moved = dict(state, position={"x": 6, "y": 5})
+    assert kernel_reward(kernel, state, moved, steps) == (0.5, 0)
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_hp_penalties_only_outside_battle(kernel):
+    """Test the low-HP penalties and that battles skip them."""
+    party = [
+        {"level": 5, "current_hp": 1, "max_hp": 10},   # < 20%: -5
+        {"level": 5, "current_hp": 4, "max_hp": 10},   # < 50%: -1
+        {"level": 5, "current_hp": 10, "max_hp": 10},  # healthy
+    ]
+    prev_state = {"position": {"x": 0, "y": 0}, "badges": 0, "party": party}
+    current_state = dict(prev_state, position={"x": 1, "y": 0})
+    assert kernel_reward(kernel, prev_state, current_state, 0) == pytest.approx((0.5 - 6.0, 0))
+
+    in_battle = dict(prev_state, in_battle=True)
+    assert kernel_reward(kernel, prev_state, in_battle, 7) == (0.0, 0)
+
+
+def test_drl_state_to_record():
+    """Test packing a state dict, keeping the first PARTY_SLOTS Pokemon."""
+    state = {
+        "position": {"x": 12, "y": 34},
+        "badges": 2,
+        "in_battle": True,
+        "party": [
+            {"level": 10 + i, "current_hp": 20 + i, "max_hp": 30 + i}
+            for i in range(5)
+        ],
+    }
+    record = drl_state_to_record(state)
+    assert (int(record['x']), int(record['y'])) == (12, 34)
+    assert int(record['badges']) == 2
+    assert bool(record['in_battle'])
+    # Only the first PARTY_SLOTS Pokemon are kept
+    assert int(record['party_count']) == 3
+    np.testing.assert_array_equal(record['level'], [10, 11, 12])
+    np.testing.assert_array_equal(record['hp'], [20, 21, 22])
+    np.testing.assert_array_equal(record['max_hp'], [30, 31, 32])
+
+
+def test_drl_state_to_record_failed_reads():
+    """Test that a failed position read and an empty party leave zeros."""
+    record = drl_state_to_record({"position": None, "party": [], "badges": 0, "in_battle": False})
+    assert (int(record['x']), int(record['y'])) == (0, 0)
+    assert int(record['party_count']) == 0
+    assert not record['hp'].any() and not record['max_hp'].any() and not record['level'].any()
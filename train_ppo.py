@@ -30,6 +30,13 @@ class PygameRenderCallback(BaseCallback):
     Uses pygame to display the game screen efficiently without spawning external processes.
     """
     
+    # Stats overlay formats
+    _STEPS_FMT = "Steps: {:,}"
+    _EPISODES_FMT = "Episodes: {}"
+    _AVG_REWARD_FMT = "Avg Reward: {:.1f}"
+    _AVG_REWARD_NA = "Avg Reward: N/A"
+    _EPISODE_LENGTH_FMT = "Episode Length: {}"
+    
     def __init__(self, env, render_freq: int = 1, fps: int = 30, verbose: int = 0):
         """
         Args:
@@ -49,12 +56,30 @@ class PygameRenderCallback(BaseCallback):
         pygame.display.set_caption("Pokemon Emerald - PPO Training")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 28)
+        # Per overlay line: (text, rendered surface, background rect)
+        self._text_cache = {}
+        
+        # Resolved once in _on_training_start
+        self._monitor = None  # Monitor wrapper: source of the episode stats
+        self._emulator = None
+        self._get_frame = None
+        self._next_render_step = 0
+        
+    def _on_training_start(self) -> None:
+        """Resolve the emulator behind the vec/Monitor wrappers once."""
+        # Get the base environment (unwrap VecMonitor and DummyVecEnv)
+        base_env = self.env.envs[0]
         
-        # Stats tracking
-        self.episode_rewards = []
-        self.episode_lengths = []
-        self.current_episode_reward = 0
-        self.current_episode_length = 0
+        # Unwrap Monitor wrapper to get the actual PokemonEmeraldEnv
+        if isinstance(base_env, Monitor):
+            self._monitor = base_env
+        if hasattr(base_env, 'env'):
+            base_env = base_env.env  # Unwrap Monitor
+        
+        self._emulator = getattr(base_env, 'emulator', None)
+        if self._emulator is not None:
+            self._get_frame = self._emulator.get_framebuffer_array  # bound once
+        self._next_render_step = self.num_timesteps
         
     def _on_step(self) -> bool:
         """
@@ -76,48 +101,47 @@ class PygameRenderCallback(BaseCallback):
                     logger.info("\n⏸️  ESC pressed - stopping training")
                     return False
         
-        # Only render every N steps to avoid slowdown
-        if self.num_timesteps % self.render_freq == 0:
-            try:
-                # Get the base environment (unwrap VecMonitor and DummyVecEnv)
-                base_env = self.env.envs[0]
-                
-                # Unwrap Monitor wrapper to get the actual PokemonEmeraldEnv
-                if hasattr(base_env, 'env'):
-                    base_env = base_env.env  # Unwrap Monitor
-                
-                # Get screenshot from emulator (skip if emulator is busy)
-                if not hasattr(base_env, 'emulator') or not base_env.emulator.core:
-                    return True  # Continue training even if we can't render
-                
-                screenshot = base_env.emulator.get_screenshot()
-                
-                if screenshot:
-                    # Convert PIL to numpy array
-                    screenshot_array = np.array(screenshot)
-                    
+        # Only render every N steps to avoid slowdown. A threshold instead of
+        # a modulo so n_envs > 1 (num_timesteps += n_envs) can't skip past it
+        if self.num_timesteps >= self._next_render_step:
+            self._next_render_step = self.num_timesteps - self.num_timesteps % self.render_freq + self.render_freq
+            # A live RGB view of the emulator's video buffer (None when the
+            # core isn't loaded); the 3x upscale below makes its own copy
+            frame = self._get_frame() if self._get_frame is not None else None
+            
+            if frame is not None:
+                try:
                     # Scale up 3x
-                    screenshot_array = np.repeat(np.repeat(screenshot_array, 3, axis=0), 3, axis=1)
+                    screenshot_array = np.repeat(np.repeat(frame, 3, axis=0), 3, axis=1)
                     
                     # Convert to pygame surface
                     surface = pygame.surfarray.make_surface(screenshot_array.swapaxes(0, 1))
                     self.screen.blit(surface, (0, 0))
                     
-                    # Draw stats overlay
-                    stats_text = [
-                        f"Steps: {self.num_timesteps:,}",
-                        f"Episodes: {len(self.episode_rewards)}",
-                        f"Avg Reward: {np.mean(self.episode_rewards[-10:]):.1f}" if self.episode_rewards else "Avg Reward: N/A",
-                        f"Episode Length: {self.current_episode_length}",
-                    ]
+                    # Draw stats overlay (episode stats come from the Monitor,
+                    # which already tracks them every step)
+                    monitor = self._monitor
+                    episode_returns = monitor.get_episode_rewards() if monitor is not None else []
+                    stats_text = (
+                        self._STEPS_FMT.format(self.num_timesteps),
+                        self._EPISODES_FMT.format(len(episode_returns)),
+                        self._AVG_REWARD_FMT.format(np.mean(episode_returns[-10:])) if episode_returns else self._AVG_REWARD_NA,
+                        self._EPISODE_LENGTH_FMT.format(len(monitor.rewards) if monitor is not None else 0),
+                    )
                     
                     y_offset = 10
-                    for text in stats_text:
+                    for line, text in enumerate(stats_text):
+                        # Only re-render a line's text when it changed
+                        cached = self._text_cache.get(line)
+                        if cached is None or cached[0] != text:
+                            text_surface = self.font.render(text, True, (255, 255, 255))
+                            bg_rect = text_surface.get_rect()
+                            bg_rect.topleft = (10, y_offset)
+                            bg_rect.inflate_ip(10, 5)
+                            cached = (text, text_surface, bg_rect)
+                            self._text_cache[line] = cached
+                        _, text_surface, bg_rect = cached
                         # Background for text
-                        text_surface = self.font.render(text, True, (255, 255, 255))
-                        bg_rect = text_surface.get_rect()
-                        bg_rect.topleft = (10, y_offset)
-                        bg_rect.inflate_ip(10, 5)
                         pygame.draw.rect(self.screen, (0, 0, 0), bg_rect)
                         # Text
                         self.screen.blit(text_surface, (10, y_offset))
@@ -129,25 +153,10 @@ class PygameRenderCallback(BaseCallback):
                     # Instead, just update display as fast as possible
                     # pygame.event.pump() at the start keeps window responsive
                     
-            except Exception as e:
-                # Don't stop training on render errors
-                if self.verbose > 0:
-                    logger.debug(f"Render skipped: {e}")
-                pass  # Continue training
-        
-        # Track episode stats
-        self.current_episode_length += 1
-        
-        # Check if episode ended (for stats tracking)
-        if hasattr(self.locals, 'dones') and self.locals.get('dones', [False])[0]:
-            self.episode_rewards.append(self.current_episode_reward)
-            self.episode_lengths.append(self.current_episode_length)
-            self.current_episode_reward = 0
-            self.current_episode_length = 0
-        else:
-            # Accumulate reward
-            if hasattr(self.locals, 'rewards'):
-                self.current_episode_reward += self.locals.get('rewards', [0])[0]
+                except pygame.error as e:
+                    # Don't stop training on render errors
+                    if self.verbose > 0:
+                        logger.debug("Render skipped: %s", e)
         
         return True  # Continue training
     
@@ -192,7 +201,8 @@ def train_ppo(
     log_dir: str = "./logs",
     tensorboard_log: str = "./tensorboard_logs",
     n_envs: int = 1,  # Number of parallel environments
-    visualize: bool = False  # If True, show pygame window (only works with n_envs=1)
+    visualize: bool = False,  # If True, show pygame window (only works with n_envs=1)
+    subproc: bool = False  # If True, run each env in its own process (SubprocVecEnv)
 ):
     """
     Train a PPO agent on Pokemon Emerald.
@@ -207,11 +217,17 @@ def train_ppo(
         tensorboard_log: Directory for tensorboard logs
         n_envs: Number of parallel environments (more = faster training)
         visualize: Show pygame window during training (only works with n_envs=1)
+        subproc: Step each emulator in its own process so n_envs envs advance
+                 in parallel (the render callback needs in-process envs, so
+                 this is ignored with visualize=True)
     """
     # Validate visualize mode
     if visualize and n_envs > 1:
         logger.warning("⚠️  visualize=True only works with n_envs=1. Setting n_envs=1.")
         n_envs = 1
+    if visualize and subproc:
+        logger.warning("⚠️  visualize=True needs an in-process env. Using DummyVecEnv.")
+        subproc = False
     
     # Create directories
     os.makedirs(os.path.dirname(model_save_path), exist_ok=True)
@@ -231,11 +247,17 @@ def train_ppo(
     # Create environment(s) - multiple for faster training
     logger.info(f"Creating {n_envs} parallel environment(s)...")
     
-    # IMPORTANT: Use DummyVecEnv for stability with mGBA emulator
-    # SubprocVecEnv can cause EOFError crashes with multiple emulator instances
-    logger.info("Using DummyVecEnv (single process, more stable)")
     env_fns = [make_env(rom_path, initial_state_path, rank=i, visualize=(visualize and i == 0)) for i in range(n_envs)]
-    env = DummyVecEnv(env_fns)
+    if subproc and n_envs > 1:
+        # Each worker builds its own emulator and loads the initial state in
+        # its own process ('spawn' so no mGBA/cffi state is inherited)
+        logger.info("Using SubprocVecEnv (one process per emulator)")
+        env = SubprocVecEnv(env_fns, start_method="spawn")
+    else:
+        # DummyVecEnv is the default for stability with mGBA emulator
+        # SubprocVecEnv can cause EOFError crashes with multiple emulator instances
+        logger.info("Using DummyVecEnv (single process, more stable)")
+        env = DummyVecEnv(env_fns)
     env = VecMonitor(env, log_dir)
     
     # Create callbacks
@@ -410,6 +432,8 @@ if __name__ == "__main__":
                         help="Number of parallel environments (recommended: 1-4 for DummyVecEnv)")
     parser.add_argument("--visualize", action="store_true",
                         help="Show pygame window during training (only works with --n-envs 1)")
+    parser.add_argument("--subproc", action="store_true",
+                        help="Run each environment in its own process (SubprocVecEnv) for parallel rollouts")
     
     args = parser.parse_args()
     
@@ -421,7 +445,8 @@ if __name__ == "__main__":
             save_freq=args.save_freq,
             model_save_path=args.model_path,
             n_envs=args.n_envs,
-            visualize=args.visualize
+            visualize=args.visualize,
+            subproc=args.subproc
         )
     else:
         test_model(
@@ -434,8 +434,8 @@ class OCRDialogueDetector:
             return False
         
         try:
-            # Convert to numpy array
-            image_np = np.array(screenshot)
+            # View as numpy array (read-only, no copy needed)
+            image_np = np.asarray(screenshot)
             if len(image_np.shape) != 3:
                 return False
             
@@ -450,122 +450,10 @@ class OCRDialogueDetector:
             if extended_region.size == 0:
                 return False
             
-            # Look for horizontal border lines using actual dialogue border colors
-            border_colors = [
-                (66, 181, 132),   # Main teal border color from debug analysis
-                (24, 165, 107),   # Secondary border color  
-                (57, 140, 49),    # Darker border variant
-                (0, 255, 156),    # Bright border accent
-                (115, 198, 165)   # Light border variant
-            ]
-            border_tolerance = 20  # Tolerance for color matching
-            
-            # Check each row for horizontal border lines
-            border_line_rows = []
-            height, width = extended_region.shape[:2]
-            
-            for row_idx in range(height):
-                row_pixels = extended_region[row_idx]
-                
-                # Count border color pixels in this row
-                border_pixels_in_row = 0
-                for pixel in row_pixels:
-                    # Check if pixel matches any of the border colors
-                    for border_color in border_colors:
-                        color_diff = np.sqrt(np.sum((pixel - np.array(border_color)) ** 2))
-                        if color_diff <= border_tolerance:
-                            border_pixels_in_row += 1
-                            break  # Don't double-count pixels
-                
-                # If significant portion of row has border colors, it's likely a border line
-                border_percentage = border_pixels_in_row / width
-                if border_percentage > 0.2:  # 20% of row width has border colors (lower threshold)
-                    border_line_rows.append(row_idx)
-            
-            # VERY strict detection to avoid false positives from environment colors
-            
-            # Require many border lines for robust detection
-            has_sufficient_border_lines = len(border_line_rows) >= 5  # Need at least 5 border lines
-            
-            # MUST have top AND bottom border lines (no exceptions for false positive prevention)
-            has_top_and_bottom_lines = False
-            if len(border_line_rows) >= 3:
-                # Check if we have lines at different heights (top and bottom)
-                min_line = min(border_line_rows)
-                max_line = max(border_line_rows)
-                if max_line - min_line > 15:  # Lines must be at least 15 pixels apart (very strict)
-                    has_top_and_bottom_lines = True
-            
-            # Additional check: look for proper dialogue box pattern (rectangular border)
-            has_rectangular_pattern = False
-            if len(border_line_rows) >= 5:
-                # Check if we have border lines spread across the dialogue region
-                height_quarter = height // 4
-                top_lines = [r for r in border_line_rows if r < height_quarter]
-                middle_lines = [r for r in border_line_rows if height_quarter <= r <= 3 * height_quarter]
-                bottom_lines = [r for r in border_line_rows if r > 3 * height_quarter]
-                
-                # Must have lines in top AND bottom, and some in middle for a proper box
-                if len(top_lines) >= 2 and len(bottom_lines) >= 2 and len(middle_lines) >= 1:
-                    has_rectangular_pattern = True
-            
-            # Extra check: ensure lines are actually horizontal (consistent across width)
-            has_proper_horizontal_lines = False
-            if len(border_line_rows) >= 3:
-                # Check that border lines extend across significant width (not just scattered pixels)
-                proper_lines = 0
-                for row_idx in border_line_rows[:10]:  # Check first 10 lines
-                    row_pixels = extended_region[row_idx]
-                    border_pixels_in_row = 0
-                    for pixel in row_pixels:
-                        for border_color in border_colors:
-                            color_diff = np.sqrt(np.sum((pixel - np.array(border_color)) ** 2))
-                            if color_diff <= border_tolerance:
-                                border_pixels_in_row += 1
-                                break
-                    
-                    # Line must span at least 50% of width to be considered a proper horizontal line
-                    if border_pixels_in_row / width > 0.5:
-                        proper_lines += 1
-                
-                if proper_lines >= 3:  # Need at least 3 proper horizontal lines
-                    has_proper_horizontal_lines = True
-            
-            # Log detection results
-            if self.debug_color_detection:
-                logger.debug(f"Border line detection: Found {len(border_line_rows)} border horizontal lines")
-                logger.debug(f"Line rows: {border_line_rows[:5]}")  # Show first 5
-                logger.debug(f"Has sufficient lines (≥5): {has_sufficient_border_lines}")
-                logger.debug(f"Has top+bottom lines (≥15px apart): {has_top_and_bottom_lines}")
-                logger.debug(f"Has rectangular pattern: {has_rectangular_pattern}")
-                logger.debug(f"Has proper horizontal lines (≥50% width): {has_proper_horizontal_lines}")
-            
-            # Final check: look for actual dialogue box background (light/white area inside borders)
-            has_dialogue_background = False
-            if len(border_line_rows) >= 3:
-                # Check middle area for dialogue background colors (light colors)
-                middle_start = height // 4
-                middle_end = 3 * height // 4
-                middle_region = extended_region[middle_start:middle_end, width//4:3*width//4]
-                
-                if middle_region.size > 0:
-                    # Look for light background colors typical of dialogue boxes
-                    light_pixels = 0
-                    total_pixels = middle_region.size // 3  # Divide by 3 for RGB
-                    
-                    for pixel in middle_region.reshape(-1, 3):
-                        # Light colors: high brightness (sum of RGB > 400) or white-ish
-                        brightness = np.sum(pixel)
-                        if brightness > 400 or (pixel[0] > 200 and pixel[1] > 200 and pixel[2] > 200):
-                            light_pixels += 1
-                    
-                    light_percentage = light_pixels / total_pixels
-                    if light_percentage > 0.3:  # At least 30% of middle area should be light (dialogue background)
-                        has_dialogue_background = True
-            
-            # Log all criteria
+            # The border/background analysis below only feeds debug logs, so
+            # skip it (and its per-pixel cost) unless color debugging is on
             if self.debug_color_detection:
-                logger.debug(f"Has dialogue background (light area): {has_dialogue_background}")
+                self._log_dialogue_box_diagnostics(extended_region)
             
             # Use simplified detection method to avoid false positives
             # Check for white background in center area
@@ -598,8 +486,7 @@ class OCRDialogueDetector:
                 is_visible = False
             
             if self.debug_color_detection:
-                logger.debug(f"Dialogue box {'VISIBLE' if is_visible else 'NOT VISIBLE'} "
-                           f"(found {len(border_line_rows)} border lines)")
+                logger.debug(f"Dialogue box {'VISIBLE' if is_visible else 'NOT VISIBLE'}")
             
             return is_visible
             
@@ -607,6 +494,69 @@ class OCRDialogueDetector:
             logger.debug(f"Dialogue box detection error: {e}")
             return False
     
+    def _log_dialogue_box_diagnostics(self, extended_region: np.ndarray):
+        """Log the border-line / background criteria for a dialogue box region (color debugging)"""
+        # Horizontal border lines using actual dialogue border colors
+        border_colors = np.array([
+            (66, 181, 132),   # Main teal border color from debug analysis
+            (24, 165, 107),   # Secondary border color  
+            (57, 140, 49),    # Darker border variant
+            (0, 255, 156),    # Bright border accent
+            (115, 198, 165)   # Light border variant
+        ], dtype=np.int32)
+        border_tolerance = 20  # Tolerance for color matching
+        
+        # Per pixel: does it match any border color (Euclidean RGB distance)?
+        height, width = extended_region.shape[:2]
+        diff = extended_region[:, :, None, :3].astype(np.int32) - border_colors
+        border_mask = ((diff * diff).sum(axis=-1) <= border_tolerance ** 2).any(axis=-1)
+        border_pixels_per_row = border_mask.sum(axis=1)
+        
+        # If significant portion of row has border colors, it's likely a border line
+        border_line_rows = np.flatnonzero(border_pixels_per_row / width > 0.2).tolist()
+        
+        # Require many border lines for robust detection
+        has_sufficient_border_lines = len(border_line_rows) >= 5
+        
+        # Top AND bottom border lines at least 15 pixels apart
+        has_top_and_bottom_lines = (len(border_line_rows) >= 3 and
+                                    max(border_line_rows) - min(border_line_rows) > 15)
+        
+        # Proper dialogue box pattern: lines in top AND bottom quarters, some in the middle
+        has_rectangular_pattern = False
+        if len(border_line_rows) >= 5:
+            height_quarter = height // 4
+            top_lines = [r for r in border_line_rows if r < height_quarter]
+            middle_lines = [r for r in border_line_rows if height_quarter <= r <= 3 * height_quarter]
+            bottom_lines = [r for r in border_line_rows if r > 3 * height_quarter]
+            has_rectangular_pattern = len(top_lines) >= 2 and len(bottom_lines) >= 2 and len(middle_lines) >= 1
+        
+        # Lines must span at least 50% of width (first 10 lines)
+        has_proper_horizontal_lines = False
+        if len(border_line_rows) >= 3:
+            proper_lines = int((border_pixels_per_row[border_line_rows[:10]] / width > 0.5).sum())
+            has_proper_horizontal_lines = proper_lines >= 3
+        
+        logger.debug(f"Border line detection: Found {len(border_line_rows)} border horizontal lines")
+        logger.debug(f"Line rows: {border_line_rows[:5]}")  # Show first 5
+        logger.debug(f"Has sufficient lines (≥5): {has_sufficient_border_lines}")
+        logger.debug(f"Has top+bottom lines (≥15px apart): {has_top_and_bottom_lines}")
+        logger.debug(f"Has rectangular pattern: {has_rectangular_pattern}")
+        logger.debug(f"Has proper horizontal lines (≥50% width): {has_proper_horizontal_lines}")
+        
+        # Dialogue box background (light/white area inside borders)
+        has_dialogue_background = False
+        if len(border_line_rows) >= 3:
+            middle_region = extended_region[height // 4:3 * height // 4, width // 4:3 * width // 4, :3]
+            if middle_region.size > 0:
+                # Light colors: high brightness (sum of RGB > 400) or white-ish
+                brightness = middle_region.sum(axis=-1, dtype=np.int32)
+                light_mask = (brightness > 400) | (middle_region > 200).all(axis=-1)
+                # At least 30% of middle area should be light (dialogue background)
+                has_dialogue_background = light_mask.mean() > 0.3
+        
+        logger.debug(f"Has dialogue background (light area): {has_dialogue_background}")
+    
     def enable_color_debug(self, enabled: bool = True):
         """Enable/disable color detection debugging"""
         self.debug_color_detection = enabled
@@ -13,7 +13,7 @@ def visualize_observation(obs, title="Agent Observation"):
     """
     fig = plt.figure(figsize=(15, 5))
     
-    # === 1. Visualize the 7x7x3 map tensor ===
+    # === 1. Visualize the 3x7x7 map tensor ===
     map_data = obs['map']
     
     # Plot each channel separately
@@ -21,12 +21,12 @@ def visualize_observation(obs, title="Agent Observation"):
         ax = plt.subplot(1, 4, channel + 1)
         
         # Show heatmap
-        im = ax.imshow(map_data[:, :, channel], cmap='viridis', interpolation='nearest')
+        im = ax.imshow(map_data[channel], cmap='viridis', interpolation='nearest')
         
         # Add values as text
         for i in range(7):
             for j in range(7):
-                text = ax.text(j, i, f'{map_data[i, j, channel]:.2f}',
+                text = ax.text(j, i, f'{map_data[channel, i, j]:.2f}',
                              ha="center", va="center", color="white", fontsize=8)
         
         if channel == 0: